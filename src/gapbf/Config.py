@@ -3,11 +3,16 @@
 Handles loading and validation of configuration from YAML files using Pydantic.
 """
 
+import os
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
+from .config_yaml import YAMLLoader
+
 NODE_SEQUENCE = [str(index) for index in range(1, 10)] + list(":;<=>?@ABCDEFGHIJKLMNOPQRST")
 
 
@@ -16,7 +21,7 @@ def valid_nodes_for_grid(grid_size: int) -> list[str]:
     return NODE_SEQUENCE[: grid_size * grid_size]
 
 
-def merge_prefix_suffix(path_prefix: list[str], path_suffix: list[str]) -> list[str] | None:
+def merge_prefix_suffix(path_prefix: Sequence[str], path_suffix: Sequence[str]) -> list[str] | None:
     """Merge prefix and suffix constraints if they can describe a valid path."""
     if not path_prefix:
         return list(path_suffix)
@@ -28,7 +33,7 @@ def merge_prefix_suffix(path_prefix: list[str], path_suffix: list[str]) -> list[
         if overlap and path_prefix[-overlap:] != path_suffix[:overlap]:
             continue
 
-        merged = path_prefix + path_suffix[overlap:]
+        merged = [*path_prefix, *path_suffix[overlap:]]
         if len(merged) == len(set(merged)):
             return merged
 
@@ -39,12 +44,12 @@ class Config(BaseModel):
     """Configuration model for GAPBF application with Pydantic validation.
 
     All node values (prefix, suffix, excluded_nodes, test_path) are stored
-    as strings for consistency throughout the application.
+    as tuples of strings, so a frozen Config is immutable all the way down.
     """
 
     model_config = ConfigDict(
         extra="forbid",
-        validate_assignment=True,
+        frozen=True,
     )
 
     config_file_path: str = ""
@@ -54,17 +59,19 @@ class Config(BaseModel):
     path_max_node_distance: int = Field(default=1, ge=1)
     no_diagonal_crossings: bool = False
     no_perpendicular_crossings: bool = False
-    path_prefix: list[str] = Field(default_factory=list)
-    path_suffix: list[str] = Field(default_factory=list)
-    excluded_nodes: list[str] = Field(default_factory=list)
+    path_prefix: tuple[str, ...] = Field(default_factory=tuple)
+    path_suffix: tuple[str, ...] = Field(default_factory=tuple)
+    excluded_nodes: tuple[str, ...] = Field(default_factory=tuple)
     attempt_delay: float = Field(default=0.0, ge=0)
-    test_path: list[str] = Field(default_factory=list)
+    test_path: tuple[str, ...] = Field(default_factory=tuple)
     stdout_normal: str = ""
     stdout_success: str = ""
     stdout_error: str = ""
     db_path: str = "~/.gapbf/gapbf.db"
     adb_timeout: int = Field(default=30, ge=1)
+    adb_persistent_shell: bool = False
     total_paths: int = Field(default=0, ge=0)
+    count_workers: int = Field(default=1, ge=1)
     echo_commands: bool = True
 
     @model_validator(mode="before")
@@ -89,17 +96,17 @@ class Config(BaseModel):
 
     @field_validator("path_prefix", "path_suffix", "excluded_nodes", "test_path", mode="before")
     @classmethod
-    def normalize_node_lists(cls, value: Any) -> list[str]:
-        """Normalize configured node lists to strings."""
+    def normalize_node_lists(cls, value: Any) -> tuple[str, ...]:
+        """Normalize configured node lists to tuples of strings, so they cannot change."""
         if value is None:
-            return []
+            return ()
         if isinstance(value, (str, bytes)):
             raise ValueError("node lists must be sequences, not strings")
-        return [str(item) for item in value]
+        return tuple(str(item) for item in value)
 
     @field_validator("path_prefix", "path_suffix", "excluded_nodes", "test_path")
     @classmethod
-    def validate_unique_nodes(cls, value: list[str], info: ValidationInfo) -> list[str]:
+    def validate_unique_nodes(cls, value: tuple[str, ...], info: ValidationInfo) -> tuple[str, ...]:
         """Reject duplicate nodes inside a single constraint list."""
         if len(value) != len(set(value)):
             raise ValueError(f"{info.field_name} cannot contain duplicate nodes")
@@ -173,10 +180,30 @@ class Config(BaseModel):
 
     @classmethod
     def load_config(cls, config_file_path: str) -> "Config":
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file, reusing the parse while the file is unchanged."""
+        try:
+            stat_result = os.stat(config_file_path)
+        except (OSError, TypeError, ValueError):
+            return cls._read_config_file(config_file_path)
+        return cls._load_cached(
+            config_file_path,
+            os.path.abspath(config_file_path),
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _load_cached(
+        cls, config_file_path: str, _abspath: str, _mtime_ns: int, _size: int
+    ) -> "Config":
+        return cls._read_config_file(config_file_path)
+
+    @classmethod
+    def _read_config_file(cls, config_file_path: str) -> "Config":
         try:
             with open(config_file_path, "r") as file_obj:
-                config_data = yaml.safe_load(file_obj) or {}
+                config_data = yaml.load(file_obj, Loader=YAMLLoader) or {}
         except FileNotFoundError:
             raise ValueError(f"Configuration file not found: {config_file_path}")
         except yaml.YAMLError as error:
@@ -195,9 +222,7 @@ class Config(BaseModel):
                 max(1, int(config_data.get("grid_size", 3)) - 1),
             ),
             "no_diagonal_crossings": config_data.get("no_diagonal_crossings", False),
-            "no_perpendicular_crossings": config_data.get(
-                "no_perpendicular_crossings", False
-            ),
+            "no_perpendicular_crossings": config_data.get("no_perpendicular_crossings", False),
             "path_prefix": to_string_list(config_data.get("path_prefix", [])),
             "path_suffix": to_string_list(config_data.get("path_suffix", [])),
             "excluded_nodes": to_string_list(config_data.get("excluded_nodes", [])),
@@ -208,7 +233,9 @@ class Config(BaseModel):
             "stdout_error": config_data.get("stdout_error", ""),
             "db_path": config_data.get("db_path", "~/.gapbf/gapbf.db"),
             "adb_timeout": config_data.get("adb_timeout", 30),
+            "adb_persistent_shell": config_data.get("adb_persistent_shell", False),
             "total_paths": config_data.get("total_paths", 0),
+            "count_workers": config_data.get("count_workers", 1),
             "echo_commands": config_data.get("echo_commands", True),
         }
 
@@ -26,10 +26,16 @@ class RunDatabase(DatabaseSchemaMixin, DatabaseOperationsMixin):
     def __init__(self, db_path: str):
         self.path = normalize_db_path(db_path)
         self._lock = Lock()
+        self._run_identities: dict[str, tuple[str, int]] = {}
+        self._run_heartbeats: dict[str, str] = {}
         self.connection = sqlite3.connect(self.path, check_same_thread=False)
         self.connection.row_factory = sqlite3.Row
         with self._lock:
             self.connection.execute("PRAGMA foreign_keys = ON")
+            # Every attempt commits on its own; WAL with NORMAL sync turns each commit into an
+            # append to the write-ahead log instead of a full rollback-journal fsync cycle.
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
         self._ensure_schema()
 
     def close(self) -> None:
@@ -17,6 +17,8 @@ _LEVEL_MAP = {
     "info": logging.INFO,
 }
 
+_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(module)s: %(message)s")
+
 
 def setup_logging(log_level: str = "error", log_file: Optional[str] = None) -> logging.Logger:
     """Configure root logger for the application.
@@ -34,23 +36,23 @@ def setup_logging(log_level: str = "error", log_file: Optional[str] = None) -> l
     # Get numeric level, default to ERROR
     level = _LEVEL_MAP.get(log_level.lower(), logging.ERROR)
 
-    # Clear any existing handlers to avoid duplicates
+    # Remove and close existing handlers so repeated setup neither duplicates output
+    # nor leaks the file descriptors of earlier file handlers
     root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
     root_logger.setLevel(level)
 
-    # Create formatter
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(module)s: %(message)s")
-
     # Add stdout handler
     stdout_handler = logging.StreamHandler(sys.stdout)
-    stdout_handler.setFormatter(formatter)
+    stdout_handler.setFormatter(_FORMATTER)
     root_logger.addHandler(stdout_handler)
 
     # Add file handler if requested
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         root_logger.addHandler(file_handler)
 
     return root_logger
@@ -1,26 +1,63 @@
 import logging
+from collections.abc import Sequence
 from concurrent.futures import Future
+from functools import lru_cache
 from threading import Lock
+from types import MappingProxyType
 
 from .Config import valid_nodes_for_grid
 from .pathfinder_async import _run_async, calculate_total_paths_async
-from .pathfinder_counting import (
-    build_indexed_moves,
-    build_move_candidates,
-    build_suffix_transitions,
-    count_paths_via_dp,
-    initial_count_states,
-)
+from .pathfinder_counting import build_suffix_transitions, initial_count_states
 from .pathfinder_geometry import (
+    GridGeometry,
     build_crossing_cache,
+    build_crossing_masks,
+    build_edge_bits,
     build_immediate_neighbors,
     build_intermediate_node_cache,
 )
+from .pathfinder_moves import (
+    build_hop_distances,
+    build_indexed_moves,
+    build_move_candidates,
+    build_move_masks,
+)
+from .pathfinder_totals import PathFinderTotalsMixin
 from .pathfinder_traversal import PathFinderTraversalMixin
 from .PathHandler import PathHandler
 
 
-class PathFinder(PathFinderTraversalMixin):
+@lru_cache(maxsize=None)
+def _grid_geometry(grid_size: int) -> GridGeometry:
+    """Build the constraint-independent tables for a grid once per process.
+
+    The tables are shared by every PathFinder on that grid, so the mappings are handed
+    out as read-only proxies.
+    """
+    graph = valid_nodes_for_grid(grid_size)
+    node_to_index = {node: index for index, node in enumerate(graph)}
+    coordinates = {
+        node: (index % grid_size, index // grid_size) for index, node in enumerate(graph)
+    }
+    nodes_by_coordinate = {coordinate: node for node, coordinate in coordinates.items()}
+    intermediate_nodes = build_intermediate_node_cache(graph, coordinates, nodes_by_coordinate)
+    crossing_cache = build_crossing_cache(graph, coordinates, node_to_index)
+    return (
+        MappingProxyType(coordinates),
+        MappingProxyType(nodes_by_coordinate),
+        MappingProxyType(intermediate_nodes),
+        MappingProxyType(build_immediate_neighbors(graph, intermediate_nodes)),
+        MappingProxyType(
+            {
+                crossing_type: MappingProxyType(crossings)
+                for crossing_type, crossings in crossing_cache.items()
+            }
+        ),
+        build_edge_bits(len(graph)),
+    )
+
+
+class PathFinder(PathFinderTraversalMixin, PathFinderTotalsMixin):
     """Generate Android pattern paths using Android-style legality rules."""
 
     _graphs: dict[int, dict[str, list[str]]] = {
@@ -33,11 +70,12 @@ class PathFinder(PathFinderTraversalMixin):
         path_min_len: int = 4,
         path_max_len: int = 36,
         path_max_node_distance: int | None = None,
-        path_prefix: list[str] | None = None,
-        path_suffix: list[str] | None = None,
-        excluded_nodes: list[str] | None = None,
+        path_prefix: Sequence[str] | None = None,
+        path_suffix: Sequence[str] | None = None,
+        excluded_nodes: Sequence[str] | None = None,
         no_diagonal_crossings: bool = False,
         no_perpendicular_crossings: bool = False,
+        count_workers: int = 1,
     ):
         if grid_size not in self._graphs:
             raise ValueError(
@@ -48,28 +86,21 @@ class PathFinder(PathFinderTraversalMixin):
         self._graph = list(self._graphs[grid_size]["graph"])
         self._node_to_index = {node: index for index, node in enumerate(self._graph)}
         self._node_masks = tuple(1 << index for index in range(len(self._graph)))
-        self._coordinates = {
-            node: (index % grid_size, index // grid_size) for index, node in enumerate(self._graph)
-        }
-        self._nodes_by_coordinate = {
-            coordinate: node for node, coordinate in self._coordinates.items()
-        }
-        self._intermediate_nodes = build_intermediate_node_cache(
-            self._graph,
+        (
             self._coordinates,
             self._nodes_by_coordinate,
-        )
-        self._neighbors = build_immediate_neighbors(self._graph, self._intermediate_nodes)
-        self._crossing_cache = build_crossing_cache(
-            self._graph,
-            self._coordinates,
-            self._node_to_index,
-        )
+            self._intermediate_nodes,
+            self._neighbors,
+            self._crossing_cache,
+            self._edge_bits,
+        ) = _grid_geometry(grid_size)
 
         self._handlers: list[PathHandler] = []
         self._total_paths: int | None = None
         self._total_paths_future: Future[int] | None = None
         self._total_paths_lock = Lock()
+        # Crossing-aware counting has no shared memo, so its start states can run in processes.
+        self._count_workers = count_workers
         self._path_min_len = path_min_len
         self._path_max_len = path_max_len
         self._path_max_node_distance = (
@@ -95,13 +126,40 @@ class PathFinder(PathFinderTraversalMixin):
             self._node_to_index,
             self._node_masks,
         )
+        self._move_masks, self._blocker_masks = build_move_masks(self._indexed_moves)
+        self._crossing_masks = build_crossing_masks(
+            self._node_to_index,
+            self._crossing_cache,
+            self._selected_crossing_types(),
+            self._edge_bits,
+        )
+        # Suffix matches are checked only when a path ends on the suffix's last node.
+        self._suffix_length = len(self._path_suffix)
+        self._suffix_last = self._path_suffix[-1] if self._path_suffix else None
         self._suffix_index_sequence = tuple(
             self._node_to_index[node] for node in self._path_suffix if node in self._node_to_index
         )
+        # Suffix pruning needs the first suffix node on the grid; otherwise nothing can match.
+        suffix_first = self._node_to_index.get(self._path_suffix[0]) if self._path_suffix else None
+        self._suffix_first_mask = 0 if suffix_first is None else self._node_masks[suffix_first]
+        self._suffix_distances = (
+            () if suffix_first is None else build_hop_distances(self._move_masks, suffix_first)
+        )
         self._suffix_transitions = build_suffix_transitions(
             self._suffix_index_sequence,
             len(self._graph),
         )
+        # Start states depend only on the configuration, so they are built once up front.
+        self._search_starts = self._initial_search_states()
+        self._count_starts = initial_count_states(
+            self._graph,
+            self._path_prefix,
+            self._excluded_nodes,
+            self._node_to_index,
+            self._node_masks,
+            self._suffix_transitions,
+            self._start_orbits(),
+        )
 
     @property
     def handlers(self) -> list[PathHandler]:
@@ -121,7 +179,7 @@ class PathFinder(PathFinderTraversalMixin):
         if not isinstance(handler, PathHandler):
             raise TypeError(f"Expected PathHandler, got {type(handler).__name__}")
         self._handlers.append(handler)
-        self.logger.debug(f"Added handler: {handler.__class__.__name__}")
+        self.logger.debug("Added handler: %s", handler.__class__.__name__)
 
     def process_path(
         self, path: list[str], total_paths: int | None = None
@@ -152,39 +210,5 @@ class PathFinder(PathFinderTraversalMixin):
             self._total_paths_future = future
             return future
 
-    def _calculate_total_paths(self) -> int:
-        if self._selected_crossing_types():
-            total_paths = self._count_paths_via_dfs()
-            if total_paths == 0:
-                raise ValueError("No paths found with given configuration. Check constraints.")
-            self.logger.info(
-                "Calculated %s total possible paths with DFS fallback for crossing constraints",
-                total_paths,
-            )
-            return total_paths
-
-        total_paths = count_paths_via_dp(
-            initial_count_states(
-                self._graph,
-                self._path_prefix,
-                self._excluded_nodes,
-                self._node_to_index,
-                self._node_masks,
-                self._suffix_transitions,
-            ),
-            self._indexed_moves,
-            self._node_masks,
-            self._suffix_transitions,
-            len(self._suffix_index_sequence),
-            self._path_min_len,
-            self._path_max_len,
-        )
-
-        if total_paths == 0:
-            raise ValueError("No paths found with given configuration. Check constraints.")
-
-        self.logger.info(f"Calculated {total_paths} total possible paths")
-        return total_paths
-
 
 __all__ = ["PathFinder", "calculate_total_paths_async"]
@@ -14,12 +14,14 @@ from .Config import Config
 from .Database import ResumeInfo, RunDatabase
 from .PathFinder import PathFinder
 
+_VALID_MODES = frozenset("apt")
+
 
 def validate_mode(value):
-    valid_modes = "apt"
-    if not set(value).issubset(set(valid_modes)):
+    if not _VALID_MODES.issuperset(value):
         raise typer.BadParameter(
-            f"Invalid mode: {value}. Allowed values are combinations of {', '.join(valid_modes)}."
+            f"Invalid mode: {value}. Allowed values are combinations of "
+            f"{', '.join(sorted(_VALID_MODES))}."
         )
     return value
 
@@ -31,10 +33,10 @@ def generate_sample_paths(path_finder, limit=10):
 def load_config(config_path: str, logger: logging.Logger) -> Config:
     try:
         config = Config.load_config(config_path)
-        logger.info(f"Loaded configuration from {config_path}")
+        logger.info("Loaded configuration from %s", config_path)
         return config
     except Exception as error:
-        logger.error(f"Failed to load configuration: {error}")
+        logger.error("Failed to load configuration: %s", error)
         raise typer.Exit(code=1) from error
 
 
@@ -46,7 +48,7 @@ def build_path_finder(config: Config, logger: logging.Logger) -> PathFinder:
         logger.info("Initialized PathFinder")
         return path_finder
     except Exception as error:
-        logger.error(f"Failed to initialize PathFinder: {error}")
+        logger.error("Failed to initialize PathFinder: %s", error)
         raise typer.Exit(code=1) from error
 
 
@@ -54,13 +56,13 @@ def resolve_total_paths(
     config: Config, path_finder: PathFinder, logger: logging.Logger, *, calculate: bool
 ) -> int | None:
     if config.total_paths > 0 and not calculate:
-        logger.info(f"Using configured total_paths={config.total_paths}")
+        logger.info("Using configured total_paths=%d", config.total_paths)
         return config.total_paths
     if not calculate:
         logger.info("Skipping expensive total_paths calculation")
         return None
     total_paths = path_finder.total_paths
-    logger.info(f"Calculated total_paths={total_paths}")
+    logger.info("Calculated total_paths=%s", total_paths)
     return total_paths
 
 
@@ -78,8 +80,8 @@ def print_dry_run_summary(config: Config, total_paths: int | None, path_finder:
     summary.add_row("Grid", f"{config.grid_size}x{config.grid_size}")
     summary.add_row("Length", f"{config.path_min_length} to {config.path_max_length}")
     summary.add_row("Move distance limit", str(config.path_max_node_distance))
-    summary.add_row("Prefix", str(config.path_prefix or "None"))
-    summary.add_row("Suffix", str(config.path_suffix or "None"))
+    summary.add_row("Prefix", str(list(config.path_prefix) or "None"))
+    summary.add_row("Suffix", str(list(config.path_suffix) or "None"))
     summary.add_row(
         "Excluded", str(list(config.excluded_nodes) if config.excluded_nodes else "None")
     )
@@ -113,9 +115,9 @@ def print_run_summary(
     summary.add_row("Grid", f"{config.grid_size}x{config.grid_size}")
     summary.add_row("Path length", f"{config.path_min_length} to {config.path_max_length}")
     summary.add_row("Move distance limit", str(config.path_max_node_distance))
-    summary.add_row("Prefix", str(config.path_prefix or "None"))
-    summary.add_row("Suffix", str(config.path_suffix or "None"))
-    summary.add_row("Excluded", str(config.excluded_nodes or "None"))
+    summary.add_row("Prefix", str(list(config.path_prefix) or "None"))
+    summary.add_row("Suffix", str(list(config.path_suffix) or "None"))
+    summary.add_row("Excluded", str(list(config.excluded_nodes) or "None"))
     summary.add_row("Total paths", format_total_paths(total_paths))
     summary.add_row(
         "Handlers",
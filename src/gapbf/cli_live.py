@@ -4,6 +4,7 @@ import sys
 import termios
 import time
 import tty
+from collections.abc import Sequence
 from concurrent.futures import Future
 from contextlib import AbstractContextManager
 from threading import Thread
@@ -106,7 +107,7 @@ def _mode_label(mode: str) -> str:
     return ", ".join([handler_classes[item]["class_"].__name__ for item in mode])
 
 
-def _format_path_constraints(values: list[str]) -> str:
+def _format_path_constraints(values: Sequence[str]) -> str:
     return "".join(values) if values else "None"
 
 
@@ -125,10 +126,12 @@ def _format_progress(paths_tested: int, total_paths: int | None) -> str:
 
 
 def _format_total_paths_state(total_paths: int | None, total_paths_state: str) -> str:
+    frame = SPINNER_FRAMES[int(time.monotonic() * 8) % len(SPINNER_FRAMES)]
+    if total_paths_state == "estimated" and total_paths is not None:
+        return f"{frame} ~{total_paths:,} estimated; counting exact total in background"
     if total_paths is not None:
         return f"{total_paths:,}"
     if total_paths_state == "counting":
-        frame = SPINNER_FRAMES[int(time.monotonic() * 8) % len(SPINNER_FRAMES)]
         return f"{frame} Counting exact total in background"
     return "Unavailable" if total_paths_state == "error" else "Unknown"
 
@@ -219,7 +222,7 @@ def sync_live_total_paths(state: LiveRunState, total_paths_future: Future[int] |
     if total_paths_future is None or not total_paths_future.done():
         return
     snapshot = state.snapshot()
-    if snapshot["total_paths"] is not None or snapshot["total_paths_state"] == "error":
+    if snapshot["total_paths_state"] in ("ready", "error"):
         return
     try:
         state.set_total_paths(total_paths_future.result())
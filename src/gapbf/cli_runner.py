@@ -52,7 +52,7 @@ def execute_search(
             console.print(render_live_dashboard(state, "GAPBF Live Run", allow_pause=True))
             console.print(f"Success: pattern found {successful_path}")
             console.print(f"Elapsed: {format_elapsed(elapsed_time)}")
-            logger.info(f"Successfully found pattern: {successful_path} in {elapsed_time:.2f}s")
+            logger.info("Successfully found pattern: %s in %.2fs", successful_path, elapsed_time)
             return
         state.mark_completed()
         session.finish("completed")
@@ -61,9 +61,7 @@ def execute_search(
         console.print(f"Elapsed: {format_elapsed(elapsed_time)}")
         if session.database is not None:
             console.print(f"History: {db_path}")
-        logger.info(
-            f"Search completed without finding successful pattern after {elapsed_time:.2f}s"
-        )
+        logger.info("Search completed without finding successful pattern after %.2fs", elapsed_time)
     except UserRequestedStop:
         state.mark_interrupted()
         session.finish("interrupted")
@@ -83,7 +81,7 @@ def execute_search(
     except Exception as error:
         state.mark_error(str(error))
         session.finish("error")
-        logger.error(f"Error during search: {error}", exc_info=True)
+        logger.exception("Error during search: %s", error)
         raise typer.Exit(code=1) from error
 
 
@@ -120,7 +118,7 @@ def run_command_impl(
             session.run_id or "None",
         )
     except Exception as error:
-        logger.error(f"Failed to initialize run session: {error}")
+        logger.error("Failed to initialize run session: %s", error)
         raise typer.Exit(code=1) from error
     path_finder = session.path_finder
     total_paths = resolve_total_paths(config, path_finder, logger, calculate=False)
@@ -145,6 +143,9 @@ def run_command_impl(
     if total_paths is None:
         state.mark_total_paths_counting()
         total_paths_future = path_finder.calculate_total_paths_async()
+        if not total_paths_future.done():
+            # Progress runs against a quick estimate until the exact count lands.
+            state.set_total_paths_estimate(path_finder.estimate_total_paths())
     try:
         execute_search(path_finder, logger, session, config.db_path, state, total_paths_future)
     finally:
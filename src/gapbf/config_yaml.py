@@ -0,0 +1,15 @@
+"""YAML loader and dumper selection for configuration files.
+
+Prefers the libyaml-backed C implementations, which parse and emit several times
+faster than PyYAML's pure Python classes, and falls back when PyYAML was built
+without libyaml.
+"""
+
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as YAMLDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
+__all__ = ["YAMLDumper", "YAMLLoader"]
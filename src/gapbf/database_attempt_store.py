@@ -13,6 +13,8 @@ from .database_common import (
 
 class DatabaseAttemptStoreMixin:
     _lock: Lock
+    _run_identities: dict[str, tuple[str, int]]
+    _run_heartbeats: dict[str, str]
     connection: sqlite3.Connection
 
     def attempt_hash_for(self, device_id: str, grid_size: int, attempt: str) -> str:
@@ -30,7 +32,10 @@ class DatabaseAttemptStoreMixin:
         self, config: Config, device_id: str
     ) -> dict[str, AttemptHistoryEntry]:
         with self._lock:
-            rows = self.connection.execute(
+            # Resume can load the full device history, so skip sqlite3.Row and unpack tuples.
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(
                 """
                 SELECT attempt, attempt_hash, result_classification
                 FROM attempts
@@ -39,12 +44,8 @@ class DatabaseAttemptStoreMixin:
                 (device_id, config.grid_size, *sorted(TERMINAL_ATTEMPT_CLASSIFICATIONS)),
             ).fetchall()
         return {
-            row["attempt_hash"]: AttemptHistoryEntry(
-                attempt=row["attempt"],
-                attempt_hash=row["attempt_hash"],
-                result_classification=row["result_classification"],
-            )
-            for row in rows
+            attempt_hash: AttemptHistoryEntry(attempt, attempt_hash, result_classification)
+            for attempt, attempt_hash, result_classification in rows
         }
 
     def get_terminal_attempt_entry(
@@ -80,19 +81,14 @@ class DatabaseAttemptStoreMixin:
         *,
         stdout: str = "",
         stderr: str = "",
+        attempt_hash: str | None = None,
     ) -> None:
         with self._lock:
-            run_row = self.connection.execute(
-                "SELECT device_id, grid_size FROM runs WHERE run_id = ?",
-                (run_id,),
-            ).fetchone()
-            if run_row is None:
-                raise ValueError(f"Unknown run_id: {run_id}")
-            attempt_hash = self.attempt_hash_for(
-                run_row["device_id"],
-                int(run_row["grid_size"]),
-                attempt,
-            )
+            device_id, grid_size = self._run_identity(run_id)
+            # Handlers hash the attempt for their history lookup already and may pass it on.
+            if attempt_hash is None:
+                attempt_hash = self.attempt_hash_for(device_id, grid_size, attempt)
+            timestamp = utc_now_iso()
             self.connection.execute(
                 """
                 INSERT INTO attempts (
@@ -104,9 +100,9 @@ class DatabaseAttemptStoreMixin:
                 """,
                 (
                     run_id,
-                    utc_now_iso(),
-                    run_row["device_id"],
-                    run_row["grid_size"],
+                    timestamp,
+                    device_id,
+                    grid_size,
                     attempt_hash,
                     attempt,
                     response,
@@ -117,11 +113,29 @@ class DatabaseAttemptStoreMixin:
                     duration_ms,
                 ),
             )
-            self.connection.execute(
-                "UPDATE runs SET updated_at = ? WHERE run_id = ?", (utc_now_iso(), run_id)
-            )
+            # Timestamps have one-second resolution, so a heartbeat already written this second
+            # would store the same value again; fast attempt loops skip that UPDATE.
+            if self._run_heartbeats.get(run_id) != timestamp:
+                self.connection.execute(
+                    "UPDATE runs SET updated_at = ? WHERE run_id = ?", (timestamp, run_id)
+                )
+                self._run_heartbeats[run_id] = timestamp
             self.connection.commit()
 
+    def _run_identity(self, run_id: str) -> tuple[str, int]:
+        # A run's device and grid never change, so look them up once per run, not per attempt.
+        identity = self._run_identities.get(run_id)
+        if identity is None:
+            run_row = self.connection.execute(
+                "SELECT device_id, grid_size FROM runs WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            if run_row is None:
+                raise ValueError(f"Unknown run_id: {run_id}")
+            identity = (run_row["device_id"], int(run_row["grid_size"]))
+            self._run_identities[run_id] = identity
+        return identity
+
     def list_attempts(
         self,
         run_id: str,
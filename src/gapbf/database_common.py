@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from .Config import Config
@@ -11,7 +13,13 @@ TERMINAL_ATTEMPT_CLASSIFICATIONS = frozenset({"normal_failure", "success"})
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return _utc_second_iso(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _utc_second_iso(epoch_second: int) -> str:
+    # Every attempt is stamped, so format each second once instead of once per attempt.
+    return datetime.fromtimestamp(epoch_second, timezone.utc).isoformat(timespec="seconds")
 
 
 def normalize_db_path(db_path: str) -> Path:
@@ -64,7 +72,7 @@ class ResumeInfo:
     latest_successful_attempt: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttemptHistoryEntry:
     attempt: str
     attempt_hash: str
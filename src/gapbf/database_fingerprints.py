@@ -23,6 +23,11 @@ class DatabaseFingerprintMixin:
     def _config_snapshot(self, config: Config) -> dict[str, object]:
         snapshot = config.model_dump()
         snapshot.pop("total_paths", None)
+        # Worker count only changes how totals are computed, so runs that differ only in
+        # it record the same fingerprint. Nothing reads the fingerprint back on resume.
+        snapshot.pop("count_workers", None)
+        # The persistent shell is transport only; it sends the same attempts either way.
+        snapshot.pop("adb_persistent_shell", None)
         snapshot.pop("config_file_path", None)
         return snapshot
 
@@ -65,6 +65,13 @@ class DatabaseSchemaMixin:
                 ON attempts (attempt_hash)
                 """
             )
+            # Covers the resume query, so loading a device's history never reads table rows.
+            self.connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_attempts_device_grid_result
+                ON attempts (device_id, grid_size, result_classification, attempt, attempt_hash)
+                """
+            )
             self.connection.commit()
 
     def _ensure_column_exists(self, table_name: str, column_name: str, definition: str) -> None:
@@ -41,6 +41,7 @@ def create_path_finder(config: Config) -> PathFinder:
         excluded_nodes=config.excluded_nodes,
         no_diagonal_crossings=config.no_diagonal_crossings,
         no_perpendicular_crossings=config.no_perpendicular_crossings,
+        count_workers=config.count_workers,
     )
 
 
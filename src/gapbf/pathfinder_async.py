@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from concurrent.futures import Future
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
 from threading import Thread
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .PathFinder import PathFinder
@@ -25,3 +26,21 @@ def _run_async(callback) -> Future[int]:
 
 def calculate_total_paths_async(path_finder: PathFinder) -> Future[int]:
     return path_finder.calculate_total_paths_async()
+
+
+def count_paths_in_processes(
+    count_function: Callable[..., int],
+    initial_states: tuple[tuple[int, int, int, int], ...],
+    count_args: tuple[Any, ...],
+    workers: int,
+) -> int:
+    """Sum ``count_function`` over each start state in a process pool.
+
+    Submitting one job per state lets idle workers take the next state as soon as they
+    finish, and the counters only take ints and tuples, so the arguments pickle cheaply.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(count_function, (state,), *count_args) for state in initial_states
+        ]
+        return sum(future.result() for future in futures)
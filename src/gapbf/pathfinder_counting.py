@@ -1,52 +1,12 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Callable
 
-MoveCandidates = dict[str, tuple[tuple[str, tuple[str, ...]], ...]]
-IndexedMoves = tuple[tuple[tuple[int, int], ...], ...]
-CountState = tuple[int, int, int]
+from .pathfinder_moves import IndexedMoves
 
-
-def build_move_candidates(
-    graph: list[str],
-    excluded_nodes: set[str],
-    intermediate_nodes: dict[tuple[str, str], tuple[str, ...]],
-    is_within_max_node_distance: Callable[[str, str], bool],
-) -> MoveCandidates:
-    move_candidates: MoveCandidates = {}
-
-    for start in graph:
-        candidates: list[tuple[str, tuple[str, ...]]] = []
-        for end in graph:
-            if start == end or end in excluded_nodes:
-                continue
-            if not is_within_max_node_distance(start, end):
-                continue
-            candidates.append((end, intermediate_nodes[(start, end)]))
-        move_candidates[start] = tuple(candidates)
-
-    return move_candidates
-
-
-def build_indexed_moves(
-    graph: list[str],
-    move_candidates: MoveCandidates,
-    node_to_index: dict[str, int],
-    node_masks: tuple[int, ...],
-) -> IndexedMoves:
-    indexed_moves: list[tuple[tuple[int, int], ...]] = []
-
-    for start in graph:
-        candidates: list[tuple[int, int]] = []
-        for end, blockers in move_candidates[start]:
-            blocker_mask = 0
-            for blocker in blockers:
-                blocker_mask |= node_masks[node_to_index[blocker]]
-            candidates.append((node_to_index[end], blocker_mask))
-        indexed_moves.append(tuple(candidates))
-
-    return tuple(indexed_moves)
+# (node index, visited mask, suffix state, multiplicity); the multiplicity scales the count
+# of a start that stands in for its symmetric copies.
+CountState = tuple[int, int, int, int]
 
 
 def build_suffix_transitions(
@@ -88,6 +48,7 @@ def initial_count_states(
     node_to_index: dict[str, int],
     node_masks: tuple[int, ...],
     suffix_transitions: tuple[tuple[int, ...], ...],
+    start_orbits: tuple[tuple[int, int], ...] = (),
 ) -> tuple[CountState, ...]:
     if path_prefix:
         visited_mask = 0
@@ -98,7 +59,12 @@ def initial_count_states(
             if suffix_transitions:
                 suffix_state = suffix_transitions[suffix_state][node_index]
         last_index = node_to_index[path_prefix[-1]]
-        return ((last_index, visited_mask, suffix_state),)
+        return ((last_index, visited_mask, suffix_state, 1),)
+    if start_orbits:
+        return tuple(
+            (node_index, node_masks[node_index], 0, orbit_size)
+            for node_index, orbit_size in start_orbits
+        )
 
     states: list[CountState] = []
     for node in graph:
@@ -106,7 +72,7 @@ def initial_count_states(
             continue
         node_index = node_to_index[node]
         suffix_state = suffix_transitions[0][node_index] if suffix_transitions else 0
-        states.append((node_index, node_masks[node_index], suffix_state))
+        states.append((node_index, node_masks[node_index], suffix_state, 1))
     return tuple(states)
 
 
@@ -142,8 +108,8 @@ def count_paths_via_dp(
             return total
 
         return sum(
-            count_from(node_index, visited_mask, suffix_state)
-            for node_index, visited_mask, suffix_state in initial_states
+            multiplicity * count_from(node_index, visited_mask, suffix_state)
+            for node_index, visited_mask, suffix_state, multiplicity in initial_states
         )
 
     @lru_cache(maxsize=None)
@@ -163,6 +129,62 @@ def count_paths_via_dp(
         return total
 
     return sum(
-        count_from_without_suffix(node_index, visited_mask)
-        for node_index, visited_mask, _ in initial_states
-    )
\ No newline at end of file
+        multiplicity * count_from_without_suffix(node_index, visited_mask)
+        for node_index, visited_mask, _, multiplicity in initial_states
+    )
+
+
+def count_paths_via_dfs(
+    initial_states: tuple[CountState, ...],
+    initial_edge_mask: int,
+    move_masks: tuple[int, ...],
+    blocker_masks: tuple[tuple[int, ...], ...],
+    crossing_masks: tuple[tuple[int, ...], ...],
+    edge_bits: tuple[tuple[int, ...], ...],
+    suffix_transitions: tuple[tuple[int, ...], ...],
+    suffix_length: int,
+    path_min_len: int,
+    path_max_len: int,
+    suffix_first_mask: int = 0,
+    suffix_distances: tuple[int, ...] = (),
+) -> int:
+    # Used edges are part of the state here, so there is nothing worth memoizing. The body
+    # sticks to ints and tuples of ints so it stays a drop-in target for a JIT compiler.
+    def count_from(
+        node_index: int, visited_mask: int, used_edge_mask: int, suffix_state: int
+    ) -> int:
+        path_length = visited_mask.bit_count()
+        total = 1 if path_length >= path_min_len and suffix_state == suffix_length else 0
+        if path_length >= path_max_len:
+            return total
+        if (
+            suffix_first_mask
+            and not visited_mask & suffix_first_mask
+            and suffix_distances[node_index] + suffix_length - 1 > path_max_len - path_length
+        ):
+            return total
+
+        node_blockers = blocker_masks[node_index]
+        node_crossings = crossing_masks[node_index]
+        node_edges = edge_bits[node_index]
+        candidates = move_masks[node_index] & ~visited_mask
+        while candidates:
+            lowest_bit = candidates & -candidates
+            candidates ^= lowest_bit
+            next_index = lowest_bit.bit_length() - 1
+            if node_blockers[next_index] & ~visited_mask:
+                continue
+            if node_crossings[next_index] & used_edge_mask:
+                continue
+            total += count_from(
+                next_index,
+                visited_mask | lowest_bit,
+                used_edge_mask | node_edges[next_index],
+                suffix_transitions[suffix_state][next_index] if suffix_transitions else 0,
+            )
+        return total
+
+    return sum(
+        multiplicity * count_from(node_index, visited_mask, initial_edge_mask, suffix_state)
+        for node_index, visited_mask, suffix_state, multiplicity in initial_states
+    )
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from math import gcd
 
 EdgeKey = tuple[str, str]
 CrossingCache = dict[str, dict[EdgeKey, frozenset[EdgeKey]]]
+# Coordinates, nodes by coordinate, intermediate nodes, neighbours, crossings, edge bits.
+# The mappings are read-only views because every PathFinder on a grid shares them.
+GridGeometry = tuple[
+    Mapping[str, tuple[int, int]],
+    Mapping[tuple[int, int], str],
+    Mapping[tuple[str, str], tuple[str, ...]],
+    Mapping[str, frozenset[str]],
+    Mapping[str, Mapping[EdgeKey, frozenset[EdgeKey]]],
+    tuple[tuple[int, ...], ...],
+]
 
 
 def build_intermediate_node_cache(
@@ -45,15 +56,14 @@ def build_intermediate_node_cache(
 def build_immediate_neighbors(
     graph: list[str],
     intermediate_nodes: dict[tuple[str, str], tuple[str, ...]],
-) -> dict[str, list[str]]:
-    neighbors: dict[str, list[str]] = {node: [] for node in graph}
-    for start in graph:
-        for end in graph:
-            if start == end:
-                continue
-            if not intermediate_nodes[(start, end)]:
-                neighbors[start].append(end)
-    return neighbors
+) -> dict[str, frozenset[str]]:
+    # Callers only test membership, which a frozenset answers without a scan.
+    return {
+        start: frozenset(
+            end for end in graph if end != start and not intermediate_nodes[(start, end)]
+        )
+        for start in graph
+    }
 
 
 def canonical_edge_key(start: str, end: str, node_to_index: dict[str, int]) -> EdgeKey:
@@ -85,16 +95,10 @@ def classify_segment_crossing(
             (point_b[1] - point_a[1]) * (point_c[0] - point_a[0])
         )
 
-    first_orientation_start = orientation(
-        first_start_point, first_end_point, second_start_point
-    )
+    first_orientation_start = orientation(first_start_point, first_end_point, second_start_point)
     first_orientation_end = orientation(first_start_point, first_end_point, second_end_point)
-    second_orientation_start = orientation(
-        second_start_point, second_end_point, first_start_point
-    )
-    second_orientation_end = orientation(
-        second_start_point, second_end_point, first_end_point
-    )
+    second_orientation_start = orientation(second_start_point, second_end_point, first_start_point)
+    second_orientation_end = orientation(second_start_point, second_end_point, first_end_point)
 
     properly_intersects = (
         first_orientation_start * first_orientation_end < 0
@@ -145,4 +149,63 @@ def build_crossing_cache(
         "perpendicular": {
             edge: frozenset(crossings) for edge, crossings in perpendicular_crossings.items()
         },
-    }
\ No newline at end of file
+    }
+
+
+def build_edge_bits(node_count: int) -> tuple[tuple[int, ...], ...]:
+    edge_bits = [[0] * node_count for _ in range(node_count)]
+    edge_id = 0
+    for start_index in range(node_count):
+        for end_index in range(start_index + 1, node_count):
+            edge_bit = 1 << edge_id
+            edge_bits[start_index][end_index] = edge_bit
+            edge_bits[end_index][start_index] = edge_bit
+            edge_id += 1
+    return tuple(tuple(row) for row in edge_bits)
+
+
+def build_crossing_masks(
+    node_to_index: dict[str, int],
+    crossing_cache: Mapping[str, Mapping[EdgeKey, frozenset[EdgeKey]]],
+    crossing_types: tuple[str, ...],
+    edge_bits: tuple[tuple[int, ...], ...],
+) -> tuple[tuple[int, ...], ...]:
+    node_count = len(edge_bits)
+    crossing_masks = [[0] * node_count for _ in range(node_count)]
+    for crossing_type in crossing_types:
+        for (start, end), crossings in crossing_cache[crossing_type].items():
+            crossing_mask = 0
+            for other_start, other_end in crossings:
+                crossing_mask |= edge_bits[node_to_index[other_start]][node_to_index[other_end]]
+            start_index = node_to_index[start]
+            end_index = node_to_index[end]
+            crossing_masks[start_index][end_index] |= crossing_mask
+            crossing_masks[end_index][start_index] |= crossing_mask
+    return tuple(tuple(row) for row in crossing_masks)
+
+
+def build_start_orbits(grid_size: int) -> tuple[tuple[int, int], ...]:
+    """Group node indices under the grid's rotations and reflections.
+
+    Returns ``(representative_index, orbit_size)`` pairs, one per orbit, with the lowest
+    index standing in for the orbit.
+    """
+    last = grid_size - 1
+    orbits: dict[int, set[int]] = {}
+    for index in range(grid_size * grid_size):
+        x, y = index % grid_size, index // grid_size
+        images = {
+            image_y * grid_size + image_x
+            for image_x, image_y in (
+                (x, y),
+                (last - x, y),
+                (x, last - y),
+                (last - x, last - y),
+                (y, x),
+                (last - y, x),
+                (y, last - x),
+                (last - y, last - x),
+            )
+        }
+        orbits.setdefault(min(images), images)
+    return tuple((representative, len(images)) for representative, images in orbits.items())
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Callable
+
+from .pathfinder_validation import PathFinderValidationMixin
+
+MoveCandidates = dict[str, tuple[tuple[str, tuple[str, ...]], ...]]
+IndexedMoves = tuple[tuple[tuple[int, int], ...], ...]
+
+
+def build_move_candidates(
+    graph: list[str],
+    excluded_nodes: set[str],
+    intermediate_nodes: Mapping[tuple[str, str], tuple[str, ...]],
+    is_within_max_node_distance: Callable[[str, str], bool],
+) -> MoveCandidates:
+    move_candidates: MoveCandidates = {}
+
+    for start in graph:
+        candidates: list[tuple[str, tuple[str, ...]]] = []
+        for end in graph:
+            if start == end or end in excluded_nodes:
+                continue
+            if not is_within_max_node_distance(start, end):
+                continue
+            candidates.append((end, intermediate_nodes[(start, end)]))
+        move_candidates[start] = tuple(candidates)
+
+    return move_candidates
+
+
+def build_indexed_moves(
+    graph: list[str],
+    move_candidates: MoveCandidates,
+    node_to_index: dict[str, int],
+    node_masks: tuple[int, ...],
+) -> IndexedMoves:
+    indexed_moves: list[tuple[tuple[int, int], ...]] = []
+
+    for start in graph:
+        candidates: list[tuple[int, int]] = []
+        for end, blockers in move_candidates[start]:
+            blocker_mask = 0
+            for blocker in blockers:
+                blocker_mask |= node_masks[node_to_index[blocker]]
+            candidates.append((node_to_index[end], blocker_mask))
+        indexed_moves.append(tuple(candidates))
+
+    return tuple(indexed_moves)
+
+
+def build_move_masks(
+    indexed_moves: IndexedMoves,
+) -> tuple[tuple[int, ...], tuple[tuple[int, ...], ...]]:
+    node_count = len(indexed_moves)
+    move_masks: list[int] = []
+    blocker_masks: list[tuple[int, ...]] = []
+    for candidates in indexed_moves:
+        move_mask = 0
+        node_blockers = [0] * node_count
+        for next_index, blocker_mask in candidates:
+            move_mask |= 1 << next_index
+            node_blockers[next_index] = blocker_mask
+        move_masks.append(move_mask)
+        blocker_masks.append(tuple(node_blockers))
+    return tuple(move_masks), tuple(blocker_masks)
+
+
+def build_hop_distances(move_masks: tuple[int, ...], target_index: int) -> tuple[int, ...]:
+    """Return the fewest moves from each node to ``target_index``.
+
+    Blockers and visited nodes are ignored, so the result is a lower bound for any real
+    path. Unreachable nodes get ``len(move_masks)``, which exceeds every remaining budget.
+    """
+    node_count = len(move_masks)
+    distances = [node_count] * node_count
+    distances[target_index] = 0
+    reached_mask = frontier_mask = 1 << target_index
+    hops = 0
+    while frontier_mask:
+        hops += 1
+        next_frontier_mask = 0
+        for node_index, move_mask in enumerate(move_masks):
+            if move_mask & frontier_mask and not reached_mask >> node_index & 1:
+                distances[node_index] = hops
+                next_frontier_mask |= 1 << node_index
+        reached_mask |= next_frontier_mask
+        frontier_mask = next_frontier_mask
+    return tuple(distances)
+
+
+class PathFinderMovesMixin(PathFinderValidationMixin):
+    """Bitmask move filters shared by the traversal loops."""
+
+    _move_masks: tuple[int, ...]
+    _blocker_masks: tuple[tuple[int, ...], ...]
+    _crossing_masks: tuple[tuple[int, ...], ...]
+
+    def _legal_move_indices(
+        self, node_index: int, visited_mask: int, used_edge_mask: int
+    ) -> list[int]:
+        blocker_masks = self._blocker_masks[node_index]
+        crossing_masks = self._crossing_masks[node_index]
+        legal_moves: list[int] = []
+        append_move = legal_moves.append
+        # Walk the unvisited candidate bits lowest first, which keeps graph order.
+        candidates = self._move_masks[node_index] & ~visited_mask
+        while candidates:
+            lowest_bit = candidates & -candidates
+            candidates ^= lowest_bit
+            next_index = lowest_bit.bit_length() - 1
+            if blocker_masks[next_index] & ~visited_mask:
+                continue
+            if crossing_masks[next_index] & used_edge_mask:
+                continue
+            append_move(next_index)
+        return legal_moves
+
+    def _legal_move_indices_without_crossings(
+        self, node_index: int, visited_mask: int, used_edge_mask: int
+    ) -> list[int]:
+        blocker_masks = self._blocker_masks[node_index]
+        legal_moves: list[int] = []
+        append_move = legal_moves.append
+        candidates = self._move_masks[node_index] & ~visited_mask
+        while candidates:
+            lowest_bit = candidates & -candidates
+            candidates ^= lowest_bit
+            next_index = lowest_bit.bit_length() - 1
+            if not blocker_masks[next_index] & ~visited_mask:
+                append_move(next_index)
+        return legal_moves
+
+    def _move_filter(self) -> Callable[[int, int, int], list[int]]:
+        # Most searches have no crossing rules, and their filter can skip the edge-mask test.
+        if self._selected_crossing_types():
+            return self._legal_move_indices
+        return self._legal_move_indices_without_crossings
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+from typing import ClassVar
+
+from .pathfinder_async import count_paths_in_processes
+from .pathfinder_counting import CountState, count_paths_via_dfs, count_paths_via_dp
+from .pathfinder_geometry import build_start_orbits
+from .pathfinder_moves import IndexedMoves
+
+
+class PathFinderTotalsMixin:
+    # Totals depend only on the search settings, so PathFinders built with the same settings
+    # share one count instead of enumerating the grid again.
+    _total_paths_cache: ClassVar[dict[tuple[object, ...], int]] = {}
+
+    logger: logging.Logger
+    _grid_size: int
+    _path_min_len: int
+    _path_max_len: int
+    _path_max_node_distance: int
+    _path_prefix: list[str]
+    _path_suffix: list[str]
+    _excluded_nodes: set[str]
+    _no_diagonal_crossings: bool
+    _no_perpendicular_crossings: bool
+    _count_workers: int
+    _count_starts: tuple[CountState, ...]
+    _indexed_moves: IndexedMoves
+    _node_masks: tuple[int, ...]
+    _move_masks: tuple[int, ...]
+    _blocker_masks: tuple[tuple[int, ...], ...]
+    _edge_bits: tuple[tuple[int, ...], ...]
+    _crossing_masks: tuple[tuple[int, ...], ...]
+    _suffix_index_sequence: tuple[int, ...]
+    _suffix_transitions: tuple[tuple[int, ...], ...]
+    _suffix_first_mask: int
+    _suffix_distances: tuple[int, ...]
+
+    def _selected_crossing_types(self) -> tuple[str, ...]:
+        raise NotImplementedError
+
+    def _prefix_edge_mask(self) -> int:
+        raise NotImplementedError
+
+    def _start_orbits(self) -> tuple[tuple[int, int], ...]:
+        # Symmetric starts have equal counts unless a prefix, suffix or exclusion breaks it.
+        if self._path_prefix or self._path_suffix or self._excluded_nodes:
+            return ()
+        return build_start_orbits(self._grid_size)
+
+    def _total_paths_key(self) -> tuple[object, ...]:
+        return (
+            self._grid_size,
+            self._path_min_len,
+            self._path_max_len,
+            self._path_max_node_distance,
+            tuple(self._path_prefix),
+            tuple(self._path_suffix),
+            frozenset(self._excluded_nodes),
+            self._no_diagonal_crossings,
+            self._no_perpendicular_crossings,
+        )
+
+    def _calculate_total_paths(self) -> int:
+        key = self._total_paths_key()
+        total_paths = self._total_paths_cache.get(key)
+        if total_paths is None:
+            total_paths = self._count_total_paths()
+            self._total_paths_cache[key] = total_paths
+        return total_paths
+
+    def _count_total_paths(self) -> int:
+        initial_states = self._count_starts
+        if self._selected_crossing_types():
+            count_args = (
+                self._prefix_edge_mask(),
+                self._move_masks,
+                self._blocker_masks,
+                self._crossing_masks,
+                self._edge_bits,
+                self._suffix_transitions,
+                len(self._suffix_index_sequence),
+                self._path_min_len,
+                self._path_max_len,
+                self._suffix_first_mask,
+                self._suffix_distances,
+            )
+            if self._count_workers > 1 and len(initial_states) > 1:
+                total_paths = count_paths_in_processes(
+                    count_paths_via_dfs, initial_states, count_args, self._count_workers
+                )
+            else:
+                total_paths = count_paths_via_dfs(initial_states, *count_args)
+            if total_paths == 0:
+                raise ValueError("No paths found with given configuration. Check constraints.")
+            self.logger.info(
+                "Calculated %s total possible paths with DFS fallback for crossing constraints",
+                total_paths,
+            )
+            return total_paths
+
+        total_paths = count_paths_via_dp(
+            initial_states,
+            self._indexed_moves,
+            self._node_masks,
+            self._suffix_transitions,
+            len(self._suffix_index_sequence),
+            self._path_min_len,
+            self._path_max_len,
+        )
+
+        if total_paths == 0:
+            raise ValueError("No paths found with given configuration. Check constraints.")
+
+        self.logger.info("Calculated %d total possible paths", total_paths)
+        return total_paths
@@ -1,213 +1,203 @@
 from __future__ import annotations
 
-from .pathfinder_geometry import canonical_edge_key
+import random
+from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING
 
+from .pathfinder_moves import PathFinderMovesMixin
 
-class PathFinderTraversalMixin:
+if TYPE_CHECKING:
+    from .PathHandler import PathHandler
+
+
+class PathFinderTraversalMixin(PathFinderMovesMixin):
     _path_prefix: list[str]
     _path_suffix: list[str]
+    _suffix_length: int
+    _suffix_last: str | None
+    _suffix_first_mask: int
+    _suffix_distances: tuple[int, ...]
     _excluded_nodes: set[str]
     _node_to_index: dict[str, int]
-    _no_diagonal_crossings: bool
-    _no_perpendicular_crossings: bool
-    _crossing_cache: dict[str, dict[tuple[str, str], frozenset[tuple[str, str]]]]
-    _intermediate_nodes: dict[tuple[str, str], tuple[str, ...]]
-    _coordinates: dict[str, tuple[int, int]]
-    _path_max_node_distance: int
-    _move_candidates: dict[str, tuple[tuple[str, tuple[str, ...]], ...]]
+    _node_masks: tuple[int, ...]
+    _edge_bits: tuple[tuple[int, ...], ...]
     _path_min_len: int
     _path_max_len: int
     _graph: list[str]
-
-    def process_path(
-        self,
-        path: list[str],
-        total_paths: int | None = None,
-    ) -> tuple[bool, list[str] | None]:
-        raise NotImplementedError
-
-    def _validate_prefix(self) -> None:
-        if not self._path_prefix:
-            return
-        visited: set[str] = set()
-        used_edges: set[tuple[str, str]] = set()
-        previous: str | None = None
-        for node in self._path_prefix:
-            if node in self._excluded_nodes:
-                raise ValueError(f"path_prefix contains excluded node: {node}")
-            if node in visited:
-                raise ValueError("path_prefix cannot revisit nodes")
-            if previous is not None and not self._is_move_legal(
-                previous,
-                node,
-                visited,
-                used_edges,
-            ):
-                raise ValueError(f"illegal move in path_prefix: {previous} -> {node}")
-            if previous is not None:
-                used_edges.add(self._canonical_edge(previous, node))
-            visited.add(node)
-            previous = node
-
-    def _canonical_edge(self, start: str, end: str) -> tuple[str, str]:
-        return canonical_edge_key(start, end, self._node_to_index)
-
-    def _selected_crossing_types(self) -> tuple[str, ...]:
-        crossing_types: list[str] = []
-        if self._no_diagonal_crossings:
-            crossing_types.append("diagonal")
-        if self._no_perpendicular_crossings:
-            crossing_types.append("perpendicular")
-        return tuple(crossing_types)
-
-    def _violates_crossing_constraints(
-        self, start: str, end: str, used_edges: set[tuple[str, str]]
-    ) -> bool:
-        crossing_types = self._selected_crossing_types()
-        if not crossing_types or not used_edges:
-            return False
-
-        candidate_edge = self._canonical_edge(start, end)
-        return any(
-            any(
-                edge in used_edges
-                for edge in self._crossing_cache[crossing_type][candidate_edge]
-            )
-            for crossing_type in crossing_types
-        )
-
-    def _is_move_legal(
-        self,
-        start: str,
-        end: str,
-        visited: set[str],
-        used_edges: set[tuple[str, str]],
-    ) -> bool:
-        if start == end or end in visited or end in self._excluded_nodes:
-            return False
-        if not self._is_within_max_node_distance(start, end):
-            return False
-        blockers = self._intermediate_nodes[(start, end)]
-        if not all(blocker in visited for blocker in blockers):
-            return False
-        return not self._violates_crossing_constraints(start, end, used_edges)
-
-    def _is_within_max_node_distance(self, start: str, end: str) -> bool:
-        start_x, start_y = self._coordinates[start]
-        end_x, end_y = self._coordinates[end]
-        return (
-            max(abs(end_x - start_x), abs(end_y - start_y))
-            <= self._path_max_node_distance
-        )
-
-    def _legal_moves(
-        self, node: str, visited: set[str], used_edges: set[tuple[str, str]]
-    ) -> list[str]:
-        return [
-            candidate
-            for candidate, blockers in self._move_candidates[node]
-            if candidate not in visited
-            and all(blocker in visited for blocker in blockers)
-            and not self._violates_crossing_constraints(node, candidate, used_edges)
-        ]
+    _handlers: list[PathHandler]
+    _search_starts: tuple[tuple[int, tuple[str, ...], int, int], ...]
 
     def _path_matches_constraints(self, path: list[str]) -> bool:
         if len(path) < self._path_min_len:
             return False
-        if not self._path_suffix:
+        if self._suffix_last is None:
             return True
-        if len(path) < len(self._path_suffix):
-            return False
-        return path[-len(self._path_suffix) :] == self._path_suffix
+        return path[-1] == self._suffix_last and path[-self._suffix_length :] == self._path_suffix
+
+    def _prefix_edge_mask(self) -> int:
+        prefix_indices = [self._node_to_index[node] for node in self._path_prefix]
+        edge_mask = 0
+        for start_index, end_index in zip(prefix_indices, prefix_indices[1:]):
+            edge_mask |= self._edge_bits[start_index][end_index]
+        return edge_mask
 
-    def _initial_search_states(
-        self,
-    ) -> list[tuple[str, list[str], set[str], set[tuple[str, str]]]]:
+    def _initial_search_states(self) -> tuple[tuple[int, tuple[str, ...], int, int], ...]:
         if self._path_prefix:
-            initial_path = list(self._path_prefix[:-1])
-            initial_visited = set(initial_path)
-            initial_edges = {
-                self._canonical_edge(start, end)
-                for start, end in zip(initial_path, initial_path[1:])
-            }
-            return [
-                (self._path_prefix[-1], initial_path, initial_visited, initial_edges)
-            ]
-        return [
-            (node, [], set(), set())
-            for node in self._graph
+            prefix_indices = [self._node_to_index[node] for node in self._path_prefix]
+            initial_visited_mask = 0
+            for node_index in prefix_indices[:-1]:
+                initial_visited_mask |= self._node_masks[node_index]
+            return (
+                (
+                    prefix_indices[-1],
+                    tuple(self._path_prefix[:-1]),
+                    initial_visited_mask,
+                    self._prefix_edge_mask(),
+                ),
+            )
+        return tuple(
+            (index, (), 0, 0)
+            for index, node in enumerate(self._graph)
             if node not in self._excluded_nodes
-        ]
+        )
 
-    def _generate_paths(
-        self,
-        node: str,
-        path: list[str],
-        visited: set[str],
-        used_edges: set[tuple[str, str]],
-    ):
-        added_edge: tuple[str, str] | None = None
-        if path:
-            added_edge = self._canonical_edge(path[-1], node)
-            used_edges.add(added_edge)
-        path.append(node)
-        visited.add(node)
-        try:
+    def _walk(self) -> Iterator[list[str]]:
+        graph = self._graph
+        node_masks = self._node_masks
+        edge_bits = self._edge_bits
+        path_min_len = self._path_min_len
+        path_max_len = self._path_max_len
+        suffix = self._path_suffix
+        suffix_length = self._suffix_length
+        suffix_last = self._suffix_last
+        suffix_first_mask = self._suffix_first_mask
+        suffix_distances = self._suffix_distances
+        legal_move_indices = self._move_filter()
+        # An explicit stack of move iterators replaces recursion, so each emitted path is
+        # yielded straight to the caller instead of through one generator frame per node.
+        for start_index, prefix, visited_mask, used_edge_mask in self._search_starts:
+            path = [*prefix, graph[start_index]]
+            visited_mask |= node_masks[start_index]
             if self._path_matches_constraints(path):
-                yield list(path)
-            if len(path) >= self._path_max_len:
-                return
-            for neighbor in self._legal_moves(node, visited, used_edges):
-                yield from self._generate_paths(neighbor, path, visited, used_edges)
-        finally:
-            path.pop()
-            visited.discard(node)
-            if added_edge is not None:
-                used_edges.discard(added_edge)
-
-    def __iter__(self):
-        for start_node, path, visited, used_edges in self._initial_search_states():
-            yield from self._generate_paths(start_node, path, visited, used_edges)
-
-    def _count_paths_via_dfs(self) -> int:
-        total_paths = 0
-
-        def count_from(
-            node: str,
-            path: list[str],
-            visited: set[str],
-            used_edges: set[tuple[str, str]],
-        ) -> None:
-            nonlocal total_paths
-
-            added_edge: tuple[str, str] | None = None
-            if path:
-                added_edge = self._canonical_edge(path[-1], node)
-                used_edges.add(added_edge)
-
-            path.append(node)
-            visited.add(node)
-            try:
-                if self._path_matches_constraints(path):
-                    total_paths += 1
-                if len(path) >= self._path_max_len:
-                    return
-                for neighbor in self._legal_moves(node, visited, used_edges):
-                    count_from(neighbor, path, visited, used_edges)
-            finally:
+                yield path.copy()
+            if len(path) >= path_max_len:
+                continue
+            if (
+                suffix_first_mask
+                and not visited_mask & suffix_first_mask
+                and suffix_distances[start_index] + suffix_length - 1 > path_max_len - len(path)
+            ):
                 path.pop()
-                visited.discard(node)
-                if added_edge is not None:
-                    used_edges.discard(added_edge)
-
-        for start_node, path, visited, used_edges in self._initial_search_states():
-            count_from(start_node, path, visited, used_edges)
-
-        return total_paths
+                continue
+            stack = [
+                (
+                    start_index,
+                    visited_mask,
+                    used_edge_mask,
+                    iter(legal_move_indices(start_index, visited_mask, used_edge_mask)),
+                )
+            ]
+            while stack:
+                node_index, visited_mask, used_edge_mask, moves = stack[-1]
+                next_index = next(moves, None)
+                if next_index is None:
+                    stack.pop()
+                    path.pop()
+                    continue
+                node = graph[next_index]
+                path.append(node)
+                if len(path) >= path_min_len and (
+                    suffix_last is None or (node == suffix_last and path[-suffix_length:] == suffix)
+                ):
+                    yield path.copy()
+                if len(path) >= path_max_len:
+                    path.pop()
+                    continue
+                next_visited_mask = visited_mask | node_masks[next_index]
+                # Until the suffix has started, stop once it can no longer fit in the budget.
+                if (
+                    suffix_first_mask
+                    and not next_visited_mask & suffix_first_mask
+                    and suffix_distances[next_index] + suffix_length - 1 > path_max_len - len(path)
+                ):
+                    path.pop()
+                    continue
+                next_edge_mask = used_edge_mask | edge_bits[node_index][next_index]
+                if suffix_first_mask and next_visited_mask & suffix_first_mask:
+                    # The suffix start cannot recur, so the tail from it must already be a
+                    # proper prefix of the suffix, and the only live move is its next node.
+                    matched = len(path) - path.index(suffix[0])
+                    if matched >= suffix_length or path[-matched:] != suffix[:matched]:
+                        path.pop()
+                        continue
+                    next_node = suffix[matched]
+                    next_moves = [
+                        index
+                        for index in legal_move_indices(
+                            next_index, next_visited_mask, next_edge_mask
+                        )
+                        if graph[index] == next_node
+                    ]
+                else:
+                    next_moves = legal_move_indices(next_index, next_visited_mask, next_edge_mask)
+                stack.append((next_index, next_visited_mask, next_edge_mask, iter(next_moves)))
+
+    def __iter__(self) -> Iterator[list[str]]:
+        return self._walk()
+
+    def iter_batches(self, batch_size: int = 4096) -> Iterator[list[list[str]]]:
+        """Yield paths in lists of up to ``batch_size``, in the usual order."""
+        paths = iter(self)
+        return iter(lambda: list(islice(paths, batch_size)), [])
+
+    def estimate_total_paths(self, samples: int = 1_000, seed: int | None = None) -> int:
+        """Estimate the number of paths from random walks (Knuth's estimator).
+
+        Each walk picks uniformly among the legal moves and credits every valid path it
+        passes with the product of the branching factors so far. The mean credit is an
+        unbiased estimate of the exact count. The default sample count takes well under a
+        second even on 6x6, so runs can report a provisional total while counting.
+        """
+        rng = random.Random(seed)
+        graph = self._graph
+        node_masks = self._node_masks
+        edge_bits = self._edge_bits
+        path_max_len = self._path_max_len
+        legal_move_indices = self._move_filter()
+        path_matches_constraints = self._path_matches_constraints
+        initial_states = self._search_starts
+        if not initial_states:
+            return 0
+        total = 0
+        for _ in range(samples):
+            node_index, prefix, visited_mask, used_edge_mask = rng.choice(initial_states)
+            path = [*prefix, graph[node_index]]
+            visited_mask |= node_masks[node_index]
+            weight = len(initial_states)
+            while True:
+                if path_matches_constraints(path):
+                    total += weight
+                if len(path) >= path_max_len:
+                    break
+                moves = legal_move_indices(node_index, visited_mask, used_edge_mask)
+                if not moves:
+                    break
+                weight *= len(moves)
+                next_index = rng.choice(moves)
+                path.append(graph[next_index])
+                visited_mask |= node_masks[next_index]
+                used_edge_mask |= edge_bits[node_index][next_index]
+                node_index = next_index
+        return round(total / samples)
 
     def dfs(self, total_paths: int | None = None) -> tuple[bool, list[str]]:
+        # Handlers are fixed for the duration of a search, so dispatch goes through a local
+        # tuple instead of process_path for every emitted path.
+        handlers = tuple(self._handlers)
         for path in self:
-            success, result_path = self.process_path(path, total_paths)
-            if success:
-                return True, result_path or path
-        return False, []
\ No newline at end of file
+            for handler in handlers:
+                success, result_path = handler.handle_path(path, total_paths)
+                if success:
+                    return True, result_path or path
+        return False, []
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from .pathfinder_geometry import canonical_edge_key
+
+
+class PathFinderValidationMixin:
+    """String-level legality checks, used where a readable move is validated once."""
+
+    _path_prefix: list[str]
+    _excluded_nodes: set[str]
+    _node_to_index: dict[str, int]
+    _no_diagonal_crossings: bool
+    _no_perpendicular_crossings: bool
+    _crossing_cache: Mapping[str, Mapping[tuple[str, str], frozenset[tuple[str, str]]]]
+    _intermediate_nodes: Mapping[tuple[str, str], tuple[str, ...]]
+    _coordinates: Mapping[str, tuple[int, int]]
+    _path_max_node_distance: int
+
+    def _validate_prefix(self) -> None:
+        if not self._path_prefix:
+            return
+        visited: set[str] = set()
+        used_edges: set[tuple[str, str]] = set()
+        previous: str | None = None
+        for node in self._path_prefix:
+            if node in self._excluded_nodes:
+                raise ValueError(f"path_prefix contains excluded node: {node}")
+            if node in visited:
+                raise ValueError("path_prefix cannot revisit nodes")
+            if previous is not None and not self._is_move_legal(
+                previous,
+                node,
+                visited,
+                used_edges,
+            ):
+                raise ValueError(f"illegal move in path_prefix: {previous} -> {node}")
+            if previous is not None:
+                used_edges.add(self._canonical_edge(previous, node))
+            visited.add(node)
+            previous = node
+
+    def _canonical_edge(self, start: str, end: str) -> tuple[str, str]:
+        return canonical_edge_key(start, end, self._node_to_index)
+
+    def _selected_crossing_types(self) -> tuple[str, ...]:
+        crossing_types: list[str] = []
+        if self._no_diagonal_crossings:
+            crossing_types.append("diagonal")
+        if self._no_perpendicular_crossings:
+            crossing_types.append("perpendicular")
+        return tuple(crossing_types)
+
+    def _violates_crossing_constraints(
+        self, start: str, end: str, used_edges: set[tuple[str, str]]
+    ) -> bool:
+        crossing_types = self._selected_crossing_types()
+        if not crossing_types or not used_edges:
+            return False
+
+        candidate_edge = self._canonical_edge(start, end)
+        return any(
+            any(
+                edge in used_edges
+                for edge in self._crossing_cache[crossing_type][candidate_edge]
+            )
+            for crossing_type in crossing_types
+        )
+
+    def _is_move_legal(
+        self,
+        start: str,
+        end: str,
+        visited: set[str],
+        used_edges: set[tuple[str, str]],
+    ) -> bool:
+        if start == end or end in visited or end in self._excluded_nodes:
+            return False
+        if not self._is_within_max_node_distance(start, end):
+            return False
+        blockers = self._intermediate_nodes[(start, end)]
+        if not all(blocker in visited for blocker in blockers):
+            return False
+        return not self._violates_crossing_constraints(start, end, used_edges)
+
+    def _is_within_max_node_distance(self, start: str, end: str) -> bool:
+        start_x, start_y = self._coordinates[start]
+        end_x, end_y = self._coordinates[end]
+        return (
+            max(abs(end_x - start_x), abs(end_y - start_y))
+            <= self._path_max_node_distance
+        )
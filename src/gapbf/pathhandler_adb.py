@@ -1,18 +1,18 @@
-import subprocess
+import logging
 import time
+from collections.abc import Callable
 
 from .Config import Config
-from .Database import RunDatabase
+from .Database import TERMINAL_ATTEMPT_CLASSIFICATIONS, AttemptHistoryEntry, RunDatabase
 from .Output import Output
-from .pathhandler_common import (
-    ADBResponseClassification,
-    PathHandler,
-    _format_response,
-    _marker_matches,
-)
+from .pathhandler_adb_shell import ADBShellSession
+from .pathhandler_common import PathHandler, classify_adb_result
 
 
 class ADBHandler(PathHandler):
+    # `adb start-server` only needs to succeed once per process; the server outlives handlers.
+    _server_started = False
+
     def __init__(
         self,
         config: Config,
@@ -20,6 +20,7 @@ class ADBHandler(PathHandler):
         run_id: str,
         device_id: str,
         output: Output,
+        sleep: Callable[[float], None] = time.sleep,
     ):
         from . import PathHandler as pathhandler_module
 
@@ -27,25 +28,57 @@ class ADBHandler(PathHandler):
         self.database = database
         self.run_id = run_id
         self.device_id = device_id
+        # Injectable so tests can skip attempt_delay without patching the time module.
+        self._sleep = sleep
         self.terminal_attempt_history = self.database.get_terminal_attempt_history(
             config,
             device_id,
         )
         self.current_path_number = len(self.terminal_attempt_history)
+        # History is already scoped to this device and grid, so the attempt text is a unique
+        # key. Resumed runs skip far more paths than they try, and only tries need a hash.
+        self._terminal_attempts = {
+            entry.attempt: entry for entry in self.terminal_attempt_history.values()
+        }
 
         if self.current_path_number > 0:
             self.logger.info(
-                "Resuming from previous session: "
-                f"{self.current_path_number} paths already attempted"
+                "Resuming from previous session: %d paths already attempted",
+                self.current_path_number,
+            )
+
+        # Config is frozen, so the response markers are read once; empty markers never match.
+        self._error_marker = config.stdout_error
+        self._success_marker = config.stdout_success
+        self._normal_marker = config.stdout_normal
+        # Only the attempt changes between commands, so the rest is fixed once per handler.
+        argv_prefix = ("adb", "-s", device_id, "shell")
+        if config.echo_commands:
+            self._shell_template = (
+                "echo '[GAPBF] Attempting: {attempt}' && twrp decrypt {attempt}"
             )
+            self._argv_prefix: tuple[str, ...] = argv_prefix
+        else:
+            self._shell_template = "twrp decrypt {attempt}"
+            self._argv_prefix = (*argv_prefix, "twrp", "decrypt")
+        self.shell_session: ADBShellSession | None = None
+        if config.adb_persistent_shell:
+            # `adb shell` starts the server on demand, so the extra round trip is skipped.
+            self.shell_session = ADBShellSession(
+                ("adb", "-s", device_id, "shell"), popen=pathhandler_module.subprocess.Popen
+            )
+            return
+        if ADBHandler._server_started:
+            return
 
         try:
             pathhandler_module.subprocess.run(
                 ["adb", "start-server"], check=True, capture_output=True
             )
+            ADBHandler._server_started = True
             self.logger.info("ADB server started successfully")
         except pathhandler_module.subprocess.CalledProcessError as error:
-            self.logger.error(f"Failed to start ADB server: {error}")
+            self.logger.error("Failed to start ADB server: %s", error)
             raise
         except FileNotFoundError:
             self.logger.error("ADB command not found. Please install Android platform-tools")
@@ -58,46 +91,46 @@ class ADBHandler(PathHandler):
 
         self.current_path_number += 1
         attempt_key = "".join(path)
-        attempt_hash = self.database.attempt_hash_for(
-            self.device_id,
-            self.config.grid_size,
-            attempt_key,
-        )
-        known_result = self.terminal_attempt_history.get(attempt_hash)
+        known_result = self._terminal_attempts.get(attempt_key)
+        percentage = (self.current_path_number / total_paths * 100) if total_paths else 0
 
         if known_result is not None:
-            percentage = (self.current_path_number / total_paths * 100) if total_paths else 0
             if known_result.result_classification == "success":
                 self.logger.info("Returning cached successful path for device %s", self.device_id)
                 self.output.show_adb_success(path)
                 return True, path
             self.output.show_adb_skip(self.current_path_number, total_paths, percentage, path)
-            self.logger.info(f"Skipping previously failed path: {path}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Skipping previously failed path: %s", path)
             return False, None
 
-        percentage = (self.current_path_number / total_paths * 100) if total_paths else 0
-        self.logger.info(
-            f"Trying path {self.current_path_number}/{total_paths}: {path} (length: {len(path)})"
+        attempt_hash = self.database.attempt_hash_for(
+            self.device_id,
+            self.config.grid_size,
+            attempt_key,
         )
-
-        formatted_path = "".join(path)
-        if self.config.echo_commands:
-            command = [
-                "adb",
-                "shell",
-                f"echo '[GAPBF] Attempting: {formatted_path}' && twrp decrypt {formatted_path}",
-            ]
-        else:
-            command = ["adb", "shell", "twrp", "decrypt", formatted_path]
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Trying path %d/%s: %s (length: %d)",
+                self.current_path_number,
+                total_paths,
+                path,
+                len(path),
+            )
 
         started_at = time.perf_counter()
         try:
-            result = pathhandler_module.subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=self.config.adb_timeout,
-            )
+            if self.shell_session is not None:
+                result = self.shell_session.run(
+                    self._shell_template.format(attempt=attempt_key), self.config.adb_timeout
+                )
+            else:
+                result = pathhandler_module.subprocess.run(
+                    self._command_argv(attempt_key),
+                    capture_output=True,
+                    text=True,
+                    timeout=self.config.adb_timeout,
+                )
         except pathhandler_module.subprocess.TimeoutExpired:
             self.database.log_attempt(
                 self.run_id,
@@ -108,9 +141,10 @@ class ADBHandler(PathHandler):
                 (time.perf_counter() - started_at) * 1000,
                 stdout="",
                 stderr="",
+                attempt_hash=attempt_hash,
             )
             self.logger.error(
-                f"ADB command timed out after {self.config.adb_timeout}s for path: {path}"
+                "ADB command timed out after %ss for path: %s", self.config.adb_timeout, path
             )
             self.output.show_adb_timeout(self.current_path_number, total_paths)
             return False, None
@@ -124,12 +158,15 @@ class ADBHandler(PathHandler):
                 (time.perf_counter() - started_at) * 1000,
                 stdout="",
                 stderr=str(error),
+                attempt_hash=attempt_hash,
             )
-            self.logger.error(f"Failed to execute ADB command: {error}")
+            self.logger.error("Failed to execute ADB command: %s", error)
             self.output.show_adb_error(self.current_path_number, total_paths, str(error))
             return False, None
 
-        classified_result = self._classify_result(result)
+        classified_result = classify_adb_result(
+            result, self._error_marker, self._success_marker, self._normal_marker
+        )
         duration_ms = (time.perf_counter() - started_at) * 1000
         self.database.log_attempt(
             self.run_id,
@@ -140,15 +177,16 @@ class ADBHandler(PathHandler):
             duration_ms,
             stdout=classified_result.stdout,
             stderr=classified_result.stderr,
+            attempt_hash=attempt_hash,
         )
-        if classified_result.classification in {"normal_failure", "success"}:
-            terminal_entry = self.database.get_terminal_attempt_entry(
-                self.config,
-                self.device_id,
-                attempt_key,
+        if classified_result.classification in TERMINAL_ATTEMPT_CLASSIFICATIONS:
+            entry = AttemptHistoryEntry(
+                attempt=attempt_key,
+                attempt_hash=attempt_hash,
+                result_classification=classified_result.classification,
             )
-            if terminal_entry is not None:
-                self.terminal_attempt_history[attempt_hash] = terminal_entry
+            self.terminal_attempt_history[attempt_hash] = entry
+            self._terminal_attempts[attempt_key] = entry
 
         if classified_result.classification == "success":
             self.output.show_adb_success(path)
@@ -162,45 +200,31 @@ class ADBHandler(PathHandler):
                 self.config.attempt_delay,
             )
             if self.config.attempt_delay > 0:
-                time.sleep(self.config.attempt_delay)
+                self._sleep(self.config.attempt_delay)
             return False, None
         if classified_result.classification == "configured_error":
             error_message = (
                 classified_result.stderr or classified_result.stdout or "Configured error"
             )
-            self.logger.error(f"ADB error marker matched for path {path}: {error_message}")
+            self.logger.error("ADB error marker matched for path %s: %s", path, error_message)
             self.output.show_adb_error(self.current_path_number, total_paths, error_message)
             return False, None
 
         self.logger.error(
-            "Unexpected ADB response: "
-            f"returncode={result.returncode}, stdout={result.stdout!r}, stderr={result.stderr!r}"
+            "Unexpected ADB response: returncode=%s, stdout=%r, stderr=%r",
+            result.returncode,
+            result.stdout,
+            result.stderr,
         )
         self.output.show_adb_unexpected(self.current_path_number, total_paths)
         return False, None
 
-    def _classify_result(
-        self, result: subprocess.CompletedProcess[str]
-    ) -> ADBResponseClassification:
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-        response = _format_response(stdout, stderr)
-
-        if _marker_matches(self.config.stdout_error, stdout) or _marker_matches(
-            self.config.stdout_error, stderr
-        ):
-            classification = "configured_error"
-        elif _marker_matches(self.config.stdout_success, stdout):
-            classification = "success"
-        elif _marker_matches(self.config.stdout_normal, stdout):
-            classification = "normal_failure"
-        else:
-            classification = "unknown_response"
-
-        return ADBResponseClassification(
-            classification=classification,
-            response=response,
-            stdout=stdout,
-            stderr=stderr,
-            returncode=result.returncode,
-        )
+    def _command_argv(self, attempt_key: str) -> list[str]:
+        # Echoing needs a shell to run the compound command; otherwise adb gets plain args.
+        if self.config.echo_commands:
+            return [*self._argv_prefix, self._shell_template.format(attempt=attempt_key)]
+        return [*self._argv_prefix, attempt_key]
+
+    def close(self) -> None:
+        if self.shell_session is not None:
+            self.shell_session.close()
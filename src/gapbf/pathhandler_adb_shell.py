@@ -0,0 +1,111 @@
+import os
+import re
+import selectors
+import subprocess
+import time
+from collections.abc import Callable, Sequence
+
+END_MARKER = "__GAPBF_END__"
+_END = re.compile(rb"__GAPBF_END__(\d+)\r?\n")
+
+
+class ADBShellSession:
+    """Run commands over one long-lived ``adb shell`` process.
+
+    Each command is followed by a marker echo carrying its exit status. Older adbd
+    builds without shell_v2 merge stderr into stdout, so both streams are read as one
+    and the stdout marker alone ends a command.
+    """
+
+    def __init__(
+        self,
+        argv: Sequence[str] = ("adb", "shell"),
+        popen: Callable[..., subprocess.Popen[bytes]] = subprocess.Popen,
+    ):
+        self.argv = list(argv)
+        # Injectable so ADBHandler can spawn through the same subprocess module it runs.
+        self._popen = popen
+        self._process: subprocess.Popen[bytes] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._process = self._popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+
+    def run(self, command: str, timeout: float) -> subprocess.CompletedProcess[str]:
+        payload = f"{{ {command}; }} 2>&1; echo {END_MARKER}$?\n".encode("utf-8")
+        try:
+            process = self._send(payload)
+        except BrokenPipeError:
+            # The shell can exit between commands (device reconnect, adb server restart).
+            # Nothing of this command ran yet, so a fresh session can take it once.
+            self.kill()
+            process = self._send(payload)
+        assert process.stdout is not None
+
+        output = bytearray()
+        match: re.Match[bytes] | None = None
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ)
+            while match is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.kill()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                if not selector.select(remaining):
+                    continue
+                chunk = os.read(process.stdout.fileno(), 65536)
+                if not chunk:
+                    self.kill()
+                    raise RuntimeError("ADB shell session closed unexpectedly")
+                output.extend(chunk)
+                match = _END.search(output)
+
+        return subprocess.CompletedProcess(
+            self.argv + [command],
+            int(match.group(1)),
+            output[: match.start()].decode("utf-8", "replace"),
+            "",
+        )
+
+    def _send(self, payload: bytes) -> subprocess.Popen[bytes]:
+        self.start()
+        process = self._process
+        assert process is not None and process.stdin is not None
+        process.stdin.write(payload)
+        process.stdin.flush()
+        return process
+
+    def kill(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        process.kill()
+        process.wait()
+        for stream in (process.stdin, process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
+
+    def close(self, timeout: float = 5.0) -> None:
+        process = self._process
+        if process is None:
+            return
+        if process.poll() is None and process.stdin is not None:
+            try:
+                process.stdin.write(b"exit\n")
+                process.stdin.flush()
+                process.wait(timeout=timeout)
+            except (BrokenPipeError, subprocess.TimeoutExpired):
+                pass
+        self.kill()
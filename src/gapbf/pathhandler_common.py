@@ -1,4 +1,5 @@
 import logging
+import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -29,6 +30,34 @@ def _marker_matches(marker: str, text: str) -> bool:
     return bool(marker) and marker in text
 
 
+def classify_adb_result(
+    result: subprocess.CompletedProcess[str],
+    error_marker: str,
+    success_marker: str,
+    normal_marker: str,
+) -> ADBResponseClassification:
+    stdout = result.stdout or ""
+    stderr = result.stderr or ""
+    response = _format_response(stdout, stderr)
+
+    if _marker_matches(error_marker, stdout) or _marker_matches(error_marker, stderr):
+        classification = "configured_error"
+    elif _marker_matches(success_marker, stdout):
+        classification = "success"
+    elif _marker_matches(normal_marker, stdout):
+        classification = "normal_failure"
+    else:
+        classification = "unknown_response"
+
+    return ADBResponseClassification(
+        classification=classification,
+        response=response,
+        stdout=stdout,
+        stderr=stderr,
+        returncode=result.returncode,
+    )
+
+
 class PathHandler(ABC):
     def __init__(self, config: Config, output: Output):
         self.config = config
@@ -40,3 +69,6 @@ class PathHandler(ABC):
         self, path: list[str], total_paths: int | None = None
     ) -> tuple[bool, list[str] | None]:
         raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources held by the handler. The default handler holds none."""
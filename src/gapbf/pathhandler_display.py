@@ -11,9 +11,9 @@ class TestHandler(PathHandler):
         self.output.show_test_configuration(
             grid_size=config.grid_size,
             path_max_node_distance=config.path_max_node_distance,
-            path_prefix=config.path_prefix,
-            path_suffix=config.path_suffix,
-            excluded_nodes=config.excluded_nodes,
+            path_prefix=list(config.path_prefix),
+            path_suffix=list(config.path_suffix),
+            excluded_nodes=list(config.excluded_nodes),
             test_path=self.test_path,
         )
 
@@ -42,45 +42,56 @@ class TestHandler(PathHandler):
         )
         return False, None
 
+    def handle_paths(
+        self, paths: list[list[str]], total_paths: int | None = None
+    ) -> tuple[bool, list[str] | None]:
+        """Find the test path in a batch, such as one from ``PathFinder.iter_batches``.
+
+        One list lookup replaces a ``handle_path`` call per path. Only the match is
+        reported; paths before it just advance the counter.
+        """
+        try:
+            hit_index = paths.index(self.test_path)
+        except ValueError:
+            self.current_path_number += len(paths)
+            return False, None
+        self.current_path_number += hit_index
+        return self.handle_path(paths[hit_index], total_paths)
+
 
 class PrintHandler(PathHandler):
     def __init__(self, config: Config, grid_nodes: list[str], output: Output):
         super().__init__(config, output)
         self.grid_size = config.grid_size
         self.grid_nodes = grid_nodes
-        self.node_positions = {}
-        for index, node in enumerate(grid_nodes):
-            row = index // self.grid_size
-            col = index % self.grid_size
-            self.node_positions[(row, col)] = node
+        # Rendering walks the grid once per path, so keep the nodes as ready-made rows
+        # sliced straight from the flat, row-major node list.
+        self._grid_rows = tuple(
+            tuple(grid_nodes[start : start + self.grid_size])
+            for start in range(0, self.grid_size * self.grid_size, self.grid_size)
+        )
 
     def handle_path(
         self, path: list[str], total_paths: int | None = None
     ) -> tuple[bool, list[str] | None]:
-        path_rows = self.render_path(path)
-        steps_rows = self.render_path_steps(path)
+        path_rows, steps_rows = self._render_rows(path)
         self.output.show_print_path(path, path_rows, steps_rows)
         return False, None
 
     def render_path(self, path: list[str]) -> list[str]:
-        rows = []
-        for y in range(self.grid_size):
-            row = []
-            for x in range(self.grid_size):
-                node_value = self.node_positions.get((y, x))
-                row.append("●" if node_value in path else "○")
-            rows.append("".join(row))
-        return rows
+        return self._render_rows(path)[0]
 
     def render_path_steps(self, path: list[str]) -> list[str]:
-        rows = []
-        for y in range(self.grid_size):
-            row = []
-            for x in range(self.grid_size):
-                node_value = self.node_positions.get((y, x))
-                if node_value in path:
-                    row.append(f"{path.index(node_value) + 1}")
-                else:
-                    row.append("·")
-            rows.append(" ".join(row))
-        return rows
+        return self._render_rows(path)[1]
+
+    def _render_rows(self, path: list[str]) -> tuple[list[str], list[str]]:
+        step_of: dict[str | None, str] = {
+            node: str(step) for step, node in enumerate(path, start=1)
+        }
+        path_rows = []
+        steps_rows = []
+        for row_nodes in self._grid_rows:
+            steps = [step_of.get(node) for node in row_nodes]
+            path_rows.append("".join(["○" if step is None else "●" for step in steps]))
+            steps_rows.append(" ".join(["·" if step is None else step for step in steps]))
+        return path_rows, steps_rows
@@ -39,6 +39,7 @@ class RunSession:
     device_id: str | None = None
     resume_info: ResumeInfo | None = None
     known_successful_attempt: str | None = None
+    handlers: tuple[PathHandler, ...] = ()
 
     def attach_state(self, state: RunStateLike) -> None:
         state.attach_device_id(self.device_id)
@@ -57,6 +58,8 @@ class RunSession:
         self.database.finish_run(self.run_id, status, resolved_attempt)
 
     def close(self) -> None:
+        for handler in self.handlers:
+            handler.close()
         if self.database is None:
             return
         self.database.close()
@@ -74,6 +77,7 @@ def create_path_finder(config: Config) -> PathFinder:
         excluded_nodes=config.excluded_nodes,
         no_diagonal_crossings=config.no_diagonal_crossings,
         no_perpendicular_crossings=config.no_perpendicular_crossings,
+        count_workers=config.count_workers,
     )
 
 
@@ -124,6 +128,7 @@ def open_run_session(config: Config, mode: str, output: Output) -> RunSession:
     device_id: str | None = None
     resume_info: ResumeInfo | None = None
     known_successful_attempt: str | None = None
+    handlers: list[PathHandler] = []
 
     try:
         if "a" in mode:
@@ -134,7 +139,7 @@ def open_run_session(config: Config, mode: str, output: Output) -> RunSession:
             )
             known_successful_attempt = resume_info.latest_successful_attempt
 
-        runtime_module.add_handlers(
+        handlers = runtime_module.add_handlers(
             path_finder,
             config,
             mode,
@@ -158,6 +163,7 @@ def open_run_session(config: Config, mode: str, output: Output) -> RunSession:
         device_id=device_id,
         resume_info=resume_info,
         known_successful_attempt=known_successful_attempt,
+        handlers=tuple(handlers),
     )
 
 
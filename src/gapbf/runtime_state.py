@@ -81,6 +81,12 @@ class RunState:
             if self.total_paths is None:
                 self.total_paths_state = "counting"
 
+    def set_total_paths_estimate(self, estimate: int) -> None:
+        with self._lock:
+            if self.total_paths_state == "counting":
+                self.total_paths = estimate
+                self.total_paths_state = "estimated"
+
     def mark_total_paths_unavailable(self, message: str) -> None:
         with self._lock:
             self.total_paths = None
@@ -157,14 +163,16 @@ class RunController:
     def __init__(self, state: RunState):
         self.state = state
 
+    # These run once per path. Each reads a single field, which is atomic, so they skip the
+    # locked full snapshot.
     def should_stop(self) -> bool:
-        return bool(self.state.snapshot()["quit_requested"])
+        return self.state.quit_requested
 
     def is_paused(self) -> bool:
-        return bool(self.state.snapshot()["paused"])
+        return self.state.paused
 
     def total_paths_provider(self) -> int | None:
-        return self.state.snapshot()["total_paths"]
+        return self.state.total_paths
 
     def on_path_selected(self, path: list[str]) -> None:
         self.state.set_current_path(path)
@@ -101,6 +101,7 @@ class WebRunController(
                     "paths_tested": 0,
                     "total_paths": config.total_paths if config.total_paths > 0 else None,
                     "total_paths_state": "ready" if config.total_paths > 0 else "counting",
+                    "total_paths_estimate": None,
                     "total_paths_elapsed_seconds": 0,
                     "total_paths_timeout_seconds": 30,
                     "current_path": "",
@@ -147,6 +148,11 @@ class WebRunController(
 
             if config.total_paths <= 0:
                 total_future = path_finder.calculate_total_paths_async()
+                if not total_future.done():
+                    # Progress runs against a quick estimate until the exact count lands.
+                    estimate = path_finder.estimate_total_paths()
+                    with self._lock:
+                        self._state["total_paths_estimate"] = estimate
                 Thread(
                     target=self._watch_total_paths,
                     args=(total_future,),
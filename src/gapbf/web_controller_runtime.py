@@ -57,9 +57,11 @@ class WebRunControllerRuntimeMixin:
                 with self._lock:
                     self._state["total_paths_elapsed_seconds"] = elapsed_seconds
                     if self._state["total_paths_state"] == "counting":
+                        estimate = self._state["total_paths_estimate"]
+                        estimated = f"~{estimate:,} estimated, " if estimate is not None else ""
                         self._state["last_feedback"] = (
-                            "Counting exact total paths "
-                            f"({elapsed_seconds}s / {int(TOTAL_PATHS_TIMEOUT_SECONDS)}s budget)"
+                            f"Counting exact total paths ({estimated}"
+                            f"{elapsed_seconds}s / {int(TOTAL_PATHS_TIMEOUT_SECONDS)}s budget)"
                         )
                 self._publish("snapshot", self.snapshot())
                 last_published_elapsed = elapsed_seconds
@@ -141,6 +143,17 @@ class WebRunControllerRuntimeMixin:
             "duration_ms": 0.0,
         }
 
+    def _state_value(self, key: str) -> Any:
+        # The search loop polls a few flags per path; reading one key avoids copying the state.
+        with self._lock:
+            return self._state[key]
+
+    def _search_total_paths(self) -> int | None:
+        total_paths = self._state_value("total_paths")
+        if not isinstance(total_paths, int):
+            total_paths = self._state_value("total_paths_estimate")
+        return total_paths if isinstance(total_paths, int) else None
+
     def _run_search(self, session: RunSession) -> None:
         with self._lock:
             self._state["status"] = "running"
@@ -149,14 +162,9 @@ class WebRunControllerRuntimeMixin:
         try:
             success, _resolved_path = execute_path_search(
                 session.path_finder,
-                should_stop=lambda: bool(self.snapshot()["stop_requested"]),
-                is_paused=lambda: bool(self.snapshot()["paused"]),
-                total_paths_provider=lambda: (
-                    self.snapshot()["total_paths"]
-                    if isinstance(self.snapshot()["total_paths"], int)
-                    or self.snapshot()["total_paths"] is None
-                    else None
-                ),
+                should_stop=lambda: bool(self._state_value("stop_requested")),
+                is_paused=lambda: bool(self._state_value("paused")),
+                total_paths_provider=self._search_total_paths,
                 on_path_selected=lambda path: self._state.__setitem__(
                     "current_path", "".join(path)
                 ),
@@ -19,6 +19,7 @@ def controller_initial_state(default_config_path: str) -> dict[str, Any]:
         "paths_tested": 0,
         "total_paths": None,
         "total_paths_state": "unknown",
+        "total_paths_estimate": None,
         "total_paths_elapsed_seconds": 0,
         "total_paths_timeout_seconds": 30,
         "current_path": "",
@@ -7,6 +7,7 @@ import yaml
 from pydantic import BaseModel, Field
 
 from .Config import Config, valid_nodes_for_grid
+from .config_yaml import YAMLDumper
 
 ALLOWED_MODES = {"a", "p", "t"}
 
@@ -131,7 +132,9 @@ def config_from_payload(config_data: dict[str, Any]) -> Config:
     normalized.setdefault("stdout_error", "")
     normalized.setdefault("db_path", "~/.gapbf/gapbf.db")
     normalized.setdefault("adb_timeout", 30)
+    normalized.setdefault("adb_persistent_shell", False)
     normalized.setdefault("total_paths", 0)
+    normalized.setdefault("count_workers", 1)
     normalized.setdefault("echo_commands", True)
     normalized.setdefault("config_file_path", normalized.get("config_file_path", "web-ui"))
     return Config(**normalized)
@@ -142,7 +145,12 @@ def save_config_to_path(path: str, config_data: dict[str, Any]) -> dict[str, Any
     config_path = Path(path).expanduser()
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with config_path.open("w", encoding="utf-8") as file_obj:
-        yaml.safe_dump(config.model_dump(exclude={"config_file_path"}), file_obj, sort_keys=False)
+        yaml.dump(
+            config.model_dump(mode="json", exclude={"config_file_path"}),
+            file_obj,
+            Dumper=YAMLDumper,
+            sort_keys=False,
+        )
     return {
         "saved_path": str(config_path),
         "config": serialize_config(config),
@@ -1,92 +1,67 @@
-import os
-import tempfile
-from unittest.mock import Mock
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
 
 import pytest
-import yaml
-
-
-@pytest.fixture
-def sample_config_data():
-    """Fixture providing sample configuration data."""
-    return {
-        "grid_size": 3,
-        "path_min_length": 4,
-        "path_max_length": 9,
-        "path_max_node_distance": 1,
-        "path_prefix": [],
-        "path_suffix": [],
-        "excluded_nodes": [],
-        "attempt_delay": 10.0,
-        "test_path": [1, 2, 3, 4, 5],
-        "stdout_normal": "Failed to decrypt",
-        "stdout_success": "Data successfully decrypted",
-        "stdout_error": "Error occurred",
-        "adb_timeout": 30,
-        "total_paths": 100,
-    }
-
-
-@pytest.fixture
-def temp_config_file(sample_config_data):
-    """Fixture that creates a temporary config file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(sample_config_data, f)
-        temp_file = f.name
-
-    yield temp_file
-
-    # Cleanup
-    try:
-        os.unlink(temp_file)
-    except FileNotFoundError:
-        pass
-
-
-@pytest.fixture
-def mock_config():
-    """Fixture providing a mock config object."""
-    config = Mock()
-    config.grid_size = 3
-    config.path_min_length = 4
-    config.path_max_length = 9
-    config.path_max_node_distance = 1
-    config.path_prefix = []
-    config.path_suffix = []
-    config.excluded_nodes = []
-    config.attempt_delay = 10.0
-    config.test_path = [1, 2, 3, 4, 5]
-    config.stdout_normal = "Failed to decrypt"
-    config.stdout_success = "Data successfully decrypted"
-    config.stdout_error = "Error occurred"
-    config.adb_timeout = 30
-    config.total_paths = 100
-    return config
-
-
-@pytest.fixture
-def mock_successful_subprocess_result():
-    """Fixture providing a mock successful subprocess result."""
-    result = Mock()
-    result.returncode = 0
-    result.stdout = "Data successfully decrypted"
-    result.stderr = ""
-    return result
-
-
-@pytest.fixture
-def mock_failed_subprocess_result():
-    """Fixture providing a mock failed subprocess result."""
-    result = Mock()
-    result.returncode = 0
-    result.stdout = "Failed to decrypt"
-    result.stderr = ""
-    return result
+
+from gapbf.Config import Config
+from gapbf.PathFinder import PathFinder
+from gapbf.PathHandler import ADBHandler
+
+
+@lru_cache(maxsize=None)
+def _cached_config(frozen_items):
+    return Config(**dict(frozen_items))
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def make_config():
+    """Fixture returning a factory that validates each distinct config payload once.
+
+    Config is frozen, so tests passing an identical payload can share one instance.
+    """
+
+    def factory(config_data):
+        return _cached_config(_freeze(config_data))
+
+    return factory
 
 
 @pytest.fixture(autouse=True)
 def clean_singletons():
-    """Fixture to clean up between tests."""
-    # No longer need to reset Logger singleton since we removed it
+    """Fixture to clean up between tests.
+
+    Both start out unset and every test resets them on teardown, so only tests that
+    touched them pay for the reset.
+    """
+    yield
+    if ADBHandler._server_started:
+        ADBHandler._server_started = False
+    if PathFinder._total_paths_cache:
+        PathFinder._total_paths_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_root_logger():
+    """Give each test an empty root logger and restore the original afterwards.
+
+    CLI and web tests call setup_logging, which would otherwise leave a handler bound
+    to that test's captured stream on the root logger for the rest of the session.
+    """
+    root_logger = logging.getLogger()
+    saved_level, saved_handlers = root_logger.level, root_logger.handlers[:]
+    root_logger.handlers.clear()
     yield
-    # No cleanup needed anymore
+    for handler in root_logger.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
@@ -1,11 +1,10 @@
-import os
-import tempfile
 from unittest.mock import mock_open, patch
 
 import pytest
 import yaml
 
 from gapbf.Config import Config
+from gapbf.config_yaml import YAMLDumper
 
 
 class TestConfig:
@@ -70,6 +69,33 @@ class TestConfig:
         with pytest.raises(ValidationError, match="path_prefix"):
             Config(path_prefix="not_a_list")
 
+        with pytest.raises(ValidationError, match="count_workers"):
+            Config(count_workers=0)
+
+    def test_config_is_frozen(self):
+        """Test that a loaded config cannot be mutated in place."""
+        from pydantic import ValidationError
+
+        config = Config()
+        with pytest.raises(ValidationError, match="frozen"):
+            config.grid_size = 4
+        assert config.model_copy(update={"attempt_delay": 1.5}).attempt_delay == 1.5
+        # Node lists are stored as tuples, so they cannot be changed in place either.
+        assert Config(path_prefix=[1, 2], excluded_nodes=[5]).path_prefix == ("1", "2")
+        assert isinstance(Config(test_path=[1, 2, 3, 6]).test_path, tuple)
+
+    def test_load_config_shares_an_immutable_cached_config(self, tmp_path):
+        """Test repeated loads of an unchanged file share one Config nobody can corrupt."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"path_prefix": [1, 2]}, Dumper=YAMLDumper))
+
+        first = Config.load_config(str(config_file))
+        with pytest.raises(AttributeError):
+            first.path_prefix.append("3")
+
+        assert Config.load_config(str(config_file)) is first
+        assert first.path_prefix == ("1", "2")
+
     def test_load_config_success(self):
         """Test successful config loading from YAML file."""
         yaml_content = """
@@ -99,9 +125,9 @@ total_paths: 100
             assert config.path_max_length == 9
             assert config.no_diagonal_crossings is True
             assert config.no_perpendicular_crossings is False
-            assert config.path_prefix == ["1", "2"]  # Nodes stored as strings
-            assert config.path_suffix == ["8", "9"]  # Nodes stored as strings
-            assert config.excluded_nodes == ["5"]  # Nodes stored as strings
+            assert config.path_prefix == ("1", "2")  # Nodes stored as strings
+            assert config.path_suffix == ("8", "9")  # Nodes stored as strings
+            assert config.excluded_nodes == ("5",)  # Nodes stored as strings
             assert config.attempt_delay == 10.5
             assert config.stdout_normal == "Failed to decrypt"
             assert config.stdout_success == "Data successfully decrypted"
@@ -144,7 +170,7 @@ grid_size: 4
             assert config.path_min_length == 4  # Default value
             assert config.path_max_length == 9  # Default from load_config
             assert config.path_max_node_distance == 3
-            assert config.path_prefix == []  # Default value
+            assert config.path_prefix == ()  # Default value
             assert config.attempt_delay == 0.0  # Default value
 
     def test_dynamic_default_path_max_node_distance_tracks_grid_size(self):
@@ -162,11 +188,12 @@ grid_size: 4
         assert "Config" in repr_str
 
 
+@pytest.mark.integration
 class TestConfigIntegration:
     """Integration tests for Config with actual file operations."""
 
     def test_load_config_real_file(self):
-        """Test loading config from a real temporary file."""
+        """Test loading config from a dumped YAML payload."""
         yaml_content = {
             "grid_size": 3,
             "path_min_length": 4,
@@ -178,15 +205,27 @@ class TestConfigIntegration:
             "total_paths": 100,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(yaml_content, f)
-            temp_file = f.name
+        # The on-disk path is covered by test_load_config_reuses_parse_until_file_changes.
+        serialized = yaml.dump(yaml_content, Dumper=YAMLDumper)
+        with patch("builtins.open", mock_open(read_data=serialized)):
+            config = Config.load_config("real.yaml")
 
-        try:
-            config = Config.load_config(temp_file)
-            assert config.grid_size == 3
-            assert config.path_min_length == 4
-            assert config.stdout_normal == "Failed"
-            assert config.total_paths == 100
-        finally:
-            os.unlink(temp_file)
+        assert config.grid_size == 3
+        assert config.path_min_length == 4
+        assert config.stdout_normal == "Failed"
+        assert config.total_paths == 100
+
+    def test_load_config_reuses_parse_until_file_changes(self, tmp_path, mocker):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("grid_size: 3\nstdout_normal: Failed\n")
+        yaml_load = mocker.patch("gapbf.Config.yaml.load", wraps=yaml.load)
+
+        first = Config.load_config(str(config_path))
+        second = Config.load_config(str(config_path))
+        config_path.write_text("grid_size: 4\nstdout_normal: Failed again\n")
+        changed = Config.load_config(str(config_path))
+
+        assert yaml_load.call_count == 2
+        assert first is second
+        assert changed.grid_size == 4
+        assert changed.stdout_normal == "Failed again"
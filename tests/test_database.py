@@ -1,7 +1,10 @@
 from threading import Thread
 
+import pytest
+
 from gapbf.Config import Config
 from gapbf.Database import AttemptHistoryEntry, RunDatabase
+from gapbf.database_common import utc_now_iso
 
 
 class TestRunDatabase:
@@ -22,6 +25,99 @@ class TestRunDatabase:
         assert row["status"] == "success"
         assert row["successful_attempt"] == "1478"
 
+    def test_connection_uses_write_ahead_log(self, tmp_path):
+        database = RunDatabase(str(tmp_path / "gapbf.db"))
+        journal_mode = database.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = database.connection.execute("PRAGMA synchronous").fetchone()[0]
+        database.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1
+
+    def test_terminal_history_query_uses_covering_index(self, tmp_path):
+        database = RunDatabase(str(tmp_path / "gapbf.db"))
+        plan = database.connection.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT attempt, attempt_hash, result_classification FROM attempts
+            WHERE device_id = ? AND grid_size = ? AND result_classification IN (?, ?)
+            """,
+            ("SERIAL123", 3, "normal_failure", "success"),
+        ).fetchall()
+        database.close()
+
+        assert "COVERING INDEX idx_attempts_device_grid_result" in " ".join(
+            row["detail"] for row in plan
+        )
+
+    def test_log_attempt_stamps_attempt_and_run_heartbeat_together(self, tmp_path):
+        db_path = tmp_path / "gapbf.db"
+        config = Config(db_path=str(db_path), grid_size=3, path_min_length=4, path_max_length=9)
+
+        database = RunDatabase(str(db_path))
+        run = database.create_run(config, "SERIAL123", "a")
+        database.log_attempt(run.run_id, "1234", "Failed to decrypt", "normal_failure", 0, 15.0)
+        row = database.connection.execute(
+            "SELECT attempts.timestamp, runs.updated_at FROM attempts JOIN runs USING (run_id)"
+        ).fetchone()
+        database.close()
+
+        assert row["timestamp"] == row["updated_at"]
+
+    def test_log_attempt_writes_run_heartbeat_once_per_second(self, tmp_path, mocker):
+        db_path = tmp_path / "gapbf.db"
+        config = Config(db_path=str(db_path), grid_size=3, path_min_length=4, path_max_length=9)
+        mocker.patch(
+            "gapbf.database_attempt_store.utc_now_iso", return_value="2026-01-01T00:00:00+00:00"
+        )
+
+        database = RunDatabase(str(db_path))
+        run = database.create_run(config, "SERIAL123", "a")
+        statements = []
+        database.connection.set_trace_callback(statements.append)
+        database.log_attempt(run.run_id, "1234", "Failed to decrypt", "normal_failure", 0, 1.0)
+        database.log_attempt(run.run_id, "1235", "Failed to decrypt", "normal_failure", 0, 1.0)
+        database.close()
+
+        assert sum(statement.startswith("UPDATE runs") for statement in statements) == 1
+
+    def test_log_attempt_uses_precomputed_attempt_hash(self, tmp_path, mocker):
+        db_path = tmp_path / "gapbf.db"
+        config = Config(db_path=str(db_path), grid_size=3, path_min_length=4, path_max_length=9)
+
+        database = RunDatabase(str(db_path))
+        run = database.create_run(config, "SERIAL123", "a")
+        attempt_hash = database.attempt_hash_for("SERIAL123", 3, "1234")
+        hash_for = mocker.spy(database, "attempt_hash_for")
+        database.log_attempt(
+            run.run_id,
+            "1234",
+            "Failed to decrypt",
+            "normal_failure",
+            0,
+            1.0,
+            attempt_hash=attempt_hash,
+        )
+        stored_hash = database.connection.execute("SELECT attempt_hash FROM attempts").fetchone()
+        database.close()
+
+        hash_for.assert_not_called()
+        assert stored_hash[0] == attempt_hash
+
+    def test_log_attempt_caches_run_identity_and_rejects_unknown_runs(self, tmp_path):
+        db_path = tmp_path / "gapbf.db"
+        config = Config(db_path=str(db_path), grid_size=3, path_min_length=4, path_max_length=9)
+
+        database = RunDatabase(str(db_path))
+        run = database.create_run(config, "SERIAL123", "a")
+        database.log_attempt(run.run_id, "1234", "Failed to decrypt", "normal_failure", 0, 15.0)
+        cached_identity = database._run_identities[run.run_id]
+        with pytest.raises(ValueError, match="Unknown run_id"):
+            database.log_attempt("missing", "1235", "Failed to decrypt", "normal_failure", 0, 1.0)
+        database.close()
+
+        assert cached_identity == ("SERIAL123", 3)
+
     def test_attempts_are_available_for_resume(self, tmp_path):
         db_path = tmp_path / "gapbf.db"
         config = Config(db_path=str(db_path), grid_size=3, path_min_length=4, path_max_length=9)
@@ -144,3 +240,8 @@ class TestRunDatabase:
 
         assert first != second
         assert first != third
+
+    def test_utc_now_iso_truncates_to_the_current_second(self, mocker):
+        mocker.patch("gapbf.database_common.time.time", return_value=1767225600.9)
+
+        assert utc_now_iso() == "2026-01-01T00:00:00+00:00"
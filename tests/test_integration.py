@@ -1,292 +1,284 @@
-import os
-import tempfile
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 import yaml
 
 from gapbf.Config import Config
+from gapbf.config_yaml import YAMLDumper
 from gapbf.Database import RunDatabase
 from gapbf.PathFinder import PathFinder
 from gapbf.PathHandler import ADBHandler, PrintHandler
 from gapbf.PathHandler import TestHandler as GapbfTestHandler
 
-
+# Handlers only read these, so one instance per response serves every mocked call.
+_ADB_STARTED = SimpleNamespace(returncode=0, stdout="", stderr="")
+_ADB_SUCCESS = SimpleNamespace(returncode=0, stdout="Data successfully decrypted", stderr="")
+_ADB_FAILURE = SimpleNamespace(returncode=0, stdout="Failed to decrypt", stderr="")
+
+# Read-only payloads shared by every run of the tests below.
+_CFG_PATHFINDER = MappingProxyType(
+    {
+        "grid_size": 3,
+        "path_min_length": 4,
+        "path_max_length": 6,
+        "path_max_node_distance": 1,
+        "path_prefix": [1, 2],
+        "path_suffix": [8, 9],
+        "excluded_nodes": [5],
+        "attempt_delay": 10.0,
+        "test_path": [1, 2, 3, 4],
+        "stdout_normal": "Failed",
+        "stdout_success": "Success",
+        "stdout_error": "Error",
+        "adb_timeout": 30,
+        "total_paths": 0,
+    }
+)
+
+_CFG_TEST_HANDLER = MappingProxyType(
+    {
+        "grid_size": 3,
+        "path_min_length": 4,
+        "path_max_length": 5,
+        "path_prefix": [1],
+        "path_suffix": [5],
+        "test_path": [1, 2, 3, 6, 5],
+        "excluded_nodes": [],
+        "stdout_normal": "Failed",
+        "stdout_success": "Success",
+        "stdout_error": "Error",
+        "total_paths": 0,
+    }
+)
+
+_CFG_ADB = MappingProxyType(
+    {
+        "grid_size": 3,
+        "path_min_length": 4,
+        "path_max_length": 4,
+        "path_prefix": [1],
+        "path_suffix": [],
+        "excluded_nodes": [],
+        "attempt_delay": 0,
+        "stdout_normal": "Failed to decrypt",
+        "stdout_success": "Data successfully decrypted",
+        "stdout_error": "Error",
+        "echo_commands": False,
+        "adb_timeout": 30,
+        "total_paths": 0,
+    }
+)
+
+_CFG_PRIORITY = MappingProxyType(
+    {
+        "grid_size": 3,
+        "path_min_length": 4,
+        "path_max_length": 4,
+        "test_path": [1, 2, 3, 6],
+        "path_prefix": [],
+        "path_suffix": [],
+        "excluded_nodes": [],
+        "stdout_normal": "Failed",
+        "stdout_success": "Success",
+        "stdout_error": "Error",
+        "total_paths": 0,
+    }
+)
+
+_CFG_CONSTRAINTS = MappingProxyType(
+    {
+        "grid_size": 3,
+        "path_min_length": 5,
+        "path_max_length": 5,
+        "path_prefix": [1, 2],
+        "path_suffix": [9],
+        "excluded_nodes": [5],  # Exclude center node
+        "test_path": [1, 2, 3, 6, 9],  # Valid path meeting all constraints
+        "stdout_normal": "Failed",
+        "stdout_success": "Success",
+        "stdout_error": "Error",
+        "total_paths": 0,
+    }
+)
+
+_CFG_ADB_ERROR = MappingProxyType(
+    {
+        "grid_size": 3,
+        "stdout_normal": "Failed",
+        "stdout_success": "Success",
+        "stdout_error": "Error",
+        "adb_timeout": 30,
+        "attempt_delay": 100,
+        "total_paths": 100,
+    }
+)
+
+# Payloads that are loaded through a real YAML file rather than built in memory.
+_CONFIG_FILE_PAYLOADS = {"pathfinder": _CFG_PATHFINDER}
+
+
+@pytest.fixture(scope="session")
+def integration_config_files(tmp_path_factory):
+    """Write every file-backed integration config once per session, keyed by name."""
+    config_dir = tmp_path_factory.mktemp("integration-configs")
+    config_files = {}
+    for name, payload in _CONFIG_FILE_PAYLOADS.items():
+        config_file = config_dir / f"{name}.yaml"
+        with config_file.open("w") as f:
+            yaml.dump(dict(payload), f, Dumper=YAMLDumper)
+        config_files[name] = str(config_file)
+    return config_files
+
+
+@pytest.mark.integration
 class TestFullIntegration:
     """Integration tests that test the complete system."""
 
-    def test_config_to_pathfinder_integration(self):
+    def test_config_to_pathfinder_integration(self, integration_config_files):
         """Test that Config integrates properly with PathFinder."""
-        # Create a temporary config file
-        config_data = {
-            "grid_size": 3,
-            "path_min_length": 4,
-            "path_max_length": 6,
-            "path_max_node_distance": 1,
-            "path_prefix": [1, 2],
-            "path_suffix": [8, 9],
-            "excluded_nodes": [5],
-            "attempt_delay": 10.0,
-            "test_path": [1, 2, 3, 4],
-            "stdout_normal": "Failed",
-            "stdout_success": "Success",
-            "stdout_error": "Error",
-            "adb_timeout": 30,
-            "total_paths": 0,
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            # Load config
-            config = Config.load_config(config_file)
-
-            # Create PathFinder with config values
-            pf = PathFinder(
-                grid_size=config.grid_size,
-                path_min_len=config.path_min_length,
-                path_max_len=config.path_max_length,
-                path_max_node_distance=config.path_max_node_distance,
-                path_prefix=config.path_prefix,
-                path_suffix=config.path_suffix,
-                excluded_nodes=config.excluded_nodes,
-            )
+        config = Config.load_config(integration_config_files["pathfinder"])
 
-            # Verify PathFinder uses config values correctly
-            assert pf._grid_size == 3
-            assert pf._path_min_len == 4
-            assert pf._path_max_len == 6
-            assert pf._path_prefix == ["1", "2"]  # Nodes are strings
-            assert pf._path_suffix == ["8", "9"]  # Nodes are strings
-            assert pf._excluded_nodes == {"5"}  # Nodes are strings
+        # Create PathFinder with config values
+        pf = PathFinder(
+            grid_size=config.grid_size,
+            path_min_len=config.path_min_length,
+            path_max_len=config.path_max_length,
+            path_max_node_distance=config.path_max_node_distance,
+            path_prefix=config.path_prefix,
+            path_suffix=config.path_suffix,
+            excluded_nodes=config.excluded_nodes,
+        )
 
-        finally:
-            os.unlink(config_file)
+        # Verify PathFinder uses config values correctly
+        assert pf._grid_size == 3
+        assert pf._path_min_len == 4
+        assert pf._path_max_len == 6
+        assert pf._path_prefix == ["1", "2"]  # Nodes are strings
+        assert pf._path_suffix == ["8", "9"]  # Nodes are strings
+        assert pf._excluded_nodes == {"5"}  # Nodes are strings
 
-    def test_pathfinder_with_test_handler_integration(self):
+    def test_pathfinder_with_test_handler_integration(self, make_config):
         """Test PathFinder working with TestHandler end-to-end."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_data = {
-                "grid_size": 3,
-                "path_min_length": 4,
-                "path_max_length": 5,
-                "path_prefix": [1],
-                "path_suffix": [5],
-                "test_path": [1, 2, 3, 6, 5],
-                "excluded_nodes": [],
-                "stdout_normal": "Failed",
-                "stdout_success": "Success",
-                "stdout_error": "Error",
-                "total_paths": 0,
-            }
-            yaml.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            mock_config = Config.load_config(config_file)
-
-            pf = PathFinder(
-                grid_size=3,
-                path_min_len=4,
-                path_max_len=5,
-                path_prefix=[1],
-                path_suffix=[5],
-                excluded_nodes=[],
-            )
+        mock_config = make_config(_CFG_TEST_HANDLER)
 
-            test_handler = GapbfTestHandler(mock_config, Mock())
-            pf.add_handler(test_handler)
+        pf = PathFinder(
+            grid_size=3,
+            path_min_len=4,
+            path_max_len=5,
+            path_prefix=[1],
+            path_suffix=[5],
+            excluded_nodes=[],
+        )
 
-            success, found_path = pf.dfs()
+        test_handler = GapbfTestHandler(mock_config, Mock())
+        pf.add_handler(test_handler)
 
-            assert success is True
-            assert found_path == ["1", "2", "3", "6", "5"]
+        success, found_path = pf.dfs()
 
-        finally:
-            os.unlink(config_file)
+        assert success is True
+        assert found_path == ["1", "2", "3", "6", "5"]
 
-    @patch("subprocess.run")
-    def test_pathfinder_with_adb_handler_integration(self, mock_subprocess):
+    def test_pathfinder_with_adb_handler_integration(self, monkeypatch, make_config, tmp_path):
         """Test PathFinder working with ADBHandler (mocked)."""
-        db_path = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_data = {
-                "grid_size": 3,
-                "path_min_length": 4,
-                "path_max_length": 4,
-                "path_prefix": [1],
-                "path_suffix": [],
-                "excluded_nodes": [],
-                "attempt_delay": 0,
-                "stdout_normal": "Failed to decrypt",
-                "stdout_success": "Data successfully decrypted",
-                "stdout_error": "Error",
-                "db_path": db_path,
-                "echo_commands": False,
-                "adb_timeout": 30,
-                "total_paths": 0,
-            }
-            yaml.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            mock_config = Config.load_config(config_file)
-            database = RunDatabase(mock_config.db_path)
-            run = database.create_run(mock_config, "SERIAL123", "a")
-
-            def mock_adb_response(command, **kwargs):
-                if command[:2] == ["adb", "start-server"]:
-                    result = Mock()
-                    result.returncode = 0
-                    result.stdout = ""
-                    result.stderr = ""
-                    return result
-                if "decrypt" in command and "1236" in command:
-                    result = Mock()
-                    result.returncode = 0
-                    result.stdout = "Data successfully decrypted"
-                    result.stderr = ""
-                    return result
-
-                result = Mock()
-                result.returncode = 0
-                result.stdout = "Failed to decrypt"
-                result.stderr = ""
-                return result
-
-            mock_subprocess.side_effect = mock_adb_response
-
-            pf = PathFinder(
-                grid_size=3,
-                path_min_len=4,
-                path_max_len=4,
-                path_prefix=[1],
-                path_suffix=[],
-                excluded_nodes=[],
-            )
+        config_data = {**_CFG_ADB, "db_path": str(tmp_path / "gapbf.db")}
 
-            adb_handler = ADBHandler(
-                mock_config,
-                database=database,
-                run_id=run.run_id,
-                device_id="SERIAL123",
-                output=Mock(),
-            )
-            pf.add_handler(adb_handler)
+        mock_config = make_config(config_data)
+        database = RunDatabase(mock_config.db_path)
+        run = database.create_run(mock_config, "SERIAL123", "a")
+
+        def mock_adb_response(command, **kwargs):
+            if command[:2] == ["adb", "start-server"]:
+                return _ADB_STARTED
+            if "decrypt" in command and "1236" in command:
+                return _ADB_SUCCESS
+            return _ADB_FAILURE
+
+        monkeypatch.setattr("subprocess.run", mock_adb_response)
+
+        pf = PathFinder(
+            grid_size=3,
+            path_min_len=4,
+            path_max_len=4,
+            path_prefix=[1],
+            path_suffix=[],
+            excluded_nodes=[],
+        )
 
-            success, found_path = pf.dfs()
+        adb_handler = ADBHandler(
+            mock_config,
+            database=database,
+            run_id=run.run_id,
+            device_id="SERIAL123",
+            output=Mock(),
+        )
+        pf.add_handler(adb_handler)
 
-            assert success is True
-            assert found_path == ["1", "2", "3", "6"]
-            logged = database.get_attempted_paths(mock_config, "SERIAL123")
-            assert "1236" in logged
-            database.close()
+        success, found_path = pf.dfs()
 
-        finally:
-            os.unlink(config_file)
-            os.unlink(db_path)
+        assert success is True
+        assert found_path == ["1", "2", "3", "6"]
+        logged = database.get_attempted_paths(mock_config, "SERIAL123")
+        assert "1236" in logged
+        database.close()
 
-    def test_multiple_handlers_priority(self):
+    def test_multiple_handlers_priority(self, make_config):
         """Test that multiple handlers work and first success is returned."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_data = {
-                "grid_size": 3,
-                "path_min_length": 4,
-                "path_max_length": 4,
-                "test_path": [1, 2, 3, 6],
-                "path_prefix": [],
-                "path_suffix": [],
-                "excluded_nodes": [],
-                "stdout_normal": "Failed",
-                "stdout_success": "Success",
-                "stdout_error": "Error",
-                "total_paths": 0,
-            }
-            yaml.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            mock_config = Config.load_config(config_file)
-
-            pf = PathFinder(
-                grid_size=3,
-                path_min_len=4,
-                path_max_len=4,
-                path_prefix=[],
-                path_suffix=[],
-                excluded_nodes=[],
-            )
+        mock_config = make_config(_CFG_PRIORITY)
 
-            print_handler = PrintHandler(mock_config, pf.grid_nodes, Mock())
-            test_handler = GapbfTestHandler(mock_config, Mock())
+        pf = PathFinder(
+            grid_size=3,
+            path_min_len=4,
+            path_max_len=4,
+            path_prefix=[],
+            path_suffix=[],
+            excluded_nodes=[],
+        )
 
-            pf.add_handler(print_handler)
-            pf.add_handler(test_handler)
+        print_handler = PrintHandler(mock_config, pf.grid_nodes, Mock())
+        test_handler = GapbfTestHandler(mock_config, Mock())
 
-            success, found_path = pf.dfs()
+        pf.add_handler(print_handler)
+        pf.add_handler(test_handler)
 
-            assert success is True
-            assert found_path == ["1", "2", "3", "6"]
+        success, found_path = pf.dfs()
 
-        finally:
-            os.unlink(config_file)
+        assert success is True
+        assert found_path == ["1", "2", "3", "6"]
 
-    def test_constraint_validation_end_to_end(self):
+    def test_constraint_validation_end_to_end(self, make_config):
         """Test that constraints are properly enforced end-to-end."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_data = {
-                "grid_size": 3,
-                "path_min_length": 5,
-                "path_max_length": 5,
-                "path_prefix": [1, 2],
-                "path_suffix": [9],
-                "excluded_nodes": [5],  # Exclude center node
-                "test_path": [1, 2, 3, 6, 9],  # Valid path meeting all constraints
-                "stdout_normal": "Failed",
-                "stdout_success": "Success",
-                "stdout_error": "Error",
-                "total_paths": 0,
-            }
-            yaml.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            mock_config = Config.load_config(config_file)
-
-            pf = PathFinder(
-                grid_size=3,
-                path_min_len=5,
-                path_max_len=5,
-                path_prefix=[1, 2],
-                path_suffix=[9],
-                excluded_nodes=[5],
-            )
+        mock_config = make_config(_CFG_CONSTRAINTS)
 
-            attempted_paths = []
+        pf = PathFinder(
+            grid_size=3,
+            path_min_len=5,
+            path_max_len=5,
+            path_prefix=[1, 2],
+            path_suffix=[9],
+            excluded_nodes=[5],
+        )
 
-            class TrackingHandler(GapbfTestHandler):
-                def handle_path(self, path, total_paths=None):
-                    attempted_paths.append(path.copy())
-                    return super().handle_path(path, total_paths)
+        attempted_paths = []
 
-            tracking_handler = TrackingHandler(mock_config, Mock())
-            pf.add_handler(tracking_handler)
+        class TrackingHandler(GapbfTestHandler):
+            def handle_path(self, path, total_paths=None):
+                attempted_paths.append(path.copy())
+                return super().handle_path(path, total_paths)
 
-            success, found_path = pf.dfs()
+        tracking_handler = TrackingHandler(mock_config, Mock())
+        pf.add_handler(tracking_handler)
 
-            assert success is True
-            assert found_path == ["1", "2", "3", "6", "9"]
+        success, found_path = pf.dfs()
 
-            for path in attempted_paths:
-                assert len(path) == 5
-                assert path[0] == "1" and path[1] == "2"
-                assert path[-1] == "9"
-                assert "5" not in path
+        assert success is True
+        assert found_path == ["1", "2", "3", "6", "9"]
 
-        finally:
-            os.unlink(config_file)
+        for path in attempted_paths:
+            assert len(path) == 5
+            assert path[0] == "1" and path[1] == "2"
+            assert path[-1] == "9"
+            assert "5" not in path
 
 
 class TestErrorHandling:
@@ -316,37 +308,24 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="No paths found with given configuration"):
             pf._calculate_total_paths()
 
-    @patch("subprocess.run")
-    def test_adb_subprocess_error_handling(self, mock_subprocess):
+    @pytest.mark.integration
+    def test_adb_subprocess_error_handling(self, monkeypatch, make_config):
         """Test ADB handler handles subprocess errors gracefully."""
-        mock_subprocess.side_effect = Exception("ADB not found")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_data = {
-                "grid_size": 3,
-                "stdout_normal": "Failed",
-                "stdout_success": "Success",
-                "stdout_error": "Error",
-                "adb_timeout": 30,
-                "attempt_delay": 100,
-                "total_paths": 100,
-            }
-            yaml.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            mock_config = Config.load_config(config_file)
-            database = Mock()
-            database.get_terminal_attempt_history.return_value = {}
-
-            with pytest.raises(Exception, match="ADB not found"):
-                ADBHandler(
-                    mock_config,
-                    database=database,
-                    run_id="run-1",
-                    device_id="SERIAL123",
-                    output=Mock(),
-                )
-
-        finally:
-            os.unlink(config_file)
+
+        def missing_adb(command, **kwargs):
+            raise Exception("ADB not found")
+
+        monkeypatch.setattr("subprocess.run", missing_adb)
+
+        mock_config = make_config(_CFG_ADB_ERROR)
+        database = Mock()
+        database.get_terminal_attempt_history.return_value = {}
+
+        with pytest.raises(Exception, match="ADB not found"):
+            ADBHandler(
+                mock_config,
+                database=database,
+                run_id="run-1",
+                device_id="SERIAL123",
+                output=Mock(),
+            )
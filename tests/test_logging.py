@@ -1,5 +1,7 @@
 import logging
 
+import pytest
+
 from gapbf.Logging import setup_logging
 
 
@@ -8,9 +10,7 @@ class TestLogging:
 
     def test_setup_logging_default(self):
         """Test that setup_logging configures logging with defaults."""
-        # Clear any existing handlers
         root_logger = logging.getLogger()
-        root_logger.handlers.clear()
 
         logger = setup_logging()
 
@@ -21,7 +21,6 @@ class TestLogging:
     def test_setup_logging_custom_level(self):
         """Test that setup_logging accepts custom log level."""
         root_logger = logging.getLogger()
-        root_logger.handlers.clear()
 
         setup_logging(log_level="debug")
 
@@ -34,7 +33,6 @@ class TestLogging:
     def test_setup_logging_formatter_applied(self):
         """Test that the formatter is applied to handlers."""
         root_logger = logging.getLogger()
-        root_logger.handlers.clear()
 
         setup_logging()
 
@@ -43,11 +41,33 @@ class TestLogging:
             if isinstance(handler, logging.StreamHandler):
                 assert handler.formatter is not None
 
+    def test_setup_logging_writes_records_to_stdout(self, capsys):
+        """Test that records reach stdout through the configured handler."""
+        setup_logging()
+
+        logging.getLogger("gapbf.test").error("Test error message")
+
+        captured = capsys.readouterr()
+        assert "ERROR" in captured.out
+        assert "Test error message" in captured.out
+
+    def test_filtered_records_skip_argument_formatting(self, capsys):
+        """Test that %-style arguments are never rendered for records below the level."""
+
+        class Unrenderable:
+            def __str__(self):
+                raise AssertionError("filtered record was formatted")
+
+        setup_logging(log_level="error")
+
+        logging.getLogger("gapbf.test").debug("Path: %s", Unrenderable())
+
+        assert capsys.readouterr().out == ""
+
     def test_setup_logging_with_file(self, tmp_path):
         """Test setup_logging with file output."""
         log_file = tmp_path / "test.log"
         root_logger = logging.getLogger()
-        root_logger.handlers.clear()
 
         setup_logging(log_file=str(log_file))
 
@@ -56,19 +76,31 @@ class TestLogging:
         file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
         assert len(file_handlers) == 1
 
-    def test_setup_logging_level_mapping(self):
-        """Test that string log levels map correctly."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("level_str", "expected_level"),
+        [
             ("critical", logging.CRITICAL),
             ("error", logging.ERROR),
             ("warning", logging.WARNING),
             ("debug", logging.DEBUG),
             ("info", logging.INFO),
-        ]
+        ],
+    )
+    def test_setup_logging_level_mapping(self, level_str, expected_level):
+        """Test that string log levels map correctly."""
+        setup_logging(log_level=level_str)
 
-        for level_str, expected_level in test_cases:
-            root_logger = logging.getLogger()
-            root_logger.handlers.clear()
+        assert logging.getLogger().level == expected_level
+
+    def test_setup_logging_closes_replaced_file_handler(self, tmp_path):
+        """Test that reconfiguring logging closes the previous file handler."""
+        root_logger = logging.getLogger()
+
+        setup_logging(log_file=str(tmp_path / "first.log"))
+        first_file_handler = next(
+            h for h in root_logger.handlers if isinstance(h, logging.FileHandler)
+        )
+        setup_logging()
 
-            setup_logging(log_level=level_str)
-            assert root_logger.level == expected_level
+        assert first_file_handler not in root_logger.handlers
+        assert first_file_handler.stream is None
@@ -1,34 +1,74 @@
 import pytest
+import typer
 from typer.testing import CliRunner
 
 from gapbf.Config import Config
 from gapbf.Database import ResumeInfo, RunDatabase
-from gapbf.main import LiveRunState, _handle_live_keypress, app, handler_classes, validate_mode
+from gapbf.main import (
+    LiveRunState,
+    _handle_live_keypress,
+    app,
+    create_path_finder,
+    handler_classes,
+    main,
+    validate_mode,
+)
 
 runner = CliRunner()
 
 
-def test_validate_mode_accepts_supported_combinations():
-    assert validate_mode("a") == "a"
-    assert validate_mode("p") == "p"
-    assert validate_mode("t") == "t"
-    assert validate_mode("ap") == "ap"
-    assert validate_mode("apt") == "apt"
+@pytest.mark.parametrize("mode", ["a", "p", "t", "ap", "apt"])
+def test_validate_mode_accepts_supported_combinations(mode):
+    assert validate_mode(mode) == mode
 
 
-def test_validate_mode_rejects_invalid_modes():
-    with pytest.raises(Exception, match="Invalid mode"):
-        validate_mode("x")
+@pytest.mark.parametrize("mode", ["x", "az"])
+def test_validate_mode_rejects_invalid_modes(mode):
+    with pytest.raises(typer.BadParameter, match="Invalid mode: .* combinations of a, p, t"):
+        validate_mode(mode)
 
-    with pytest.raises(Exception, match="Invalid mode"):
-        validate_mode("az")
+
+def test_main_exits_with_usage_error_for_invalid_mode(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["gapbf", "run", "--mode", "x"])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 2
 
 
 def test_handler_classes_define_expected_handlers():
-    assert set(handler_classes) == {"a", "p", "t"}
-    assert handler_classes["a"]["class_"].__name__ == "ADBHandler"
-    assert handler_classes["p"]["class_"].__name__ == "PrintHandler"
-    assert handler_classes["t"]["class_"].__name__ == "TestHandler"
+    assert {key: spec["class_"].__name__ for key, spec in handler_classes.items()} == {
+        "a": "ADBHandler",
+        "p": "PrintHandler",
+        "t": "TestHandler",
+    }
+
+
+def test_create_path_finder_maps_config_constraints():
+    config = Config(
+        grid_size=4,
+        path_min_length=5,
+        path_max_length=6,
+        path_max_node_distance=2,
+        path_prefix=[1],
+        path_suffix=["@"],
+        excluded_nodes=[6],
+        no_diagonal_crossings=True,
+        count_workers=2,
+    )
+
+    path_finder = create_path_finder(config)
+
+    assert path_finder._grid_size == 4
+    assert (path_finder._path_min_len, path_finder._path_max_len) == (5, 6)
+    assert path_finder._path_max_node_distance == 2
+    assert path_finder._path_prefix == ["1"]
+    assert path_finder._path_suffix == ["@"]
+    assert path_finder._excluded_nodes == {"6"}
+    assert path_finder._no_diagonal_crossings is True
+    assert path_finder._no_perpendicular_crossings is False
+    assert path_finder._count_workers == 2
 
 
 def test_run_command_dry_run_uses_command_surface(mocker):
@@ -125,11 +165,56 @@ def test_web_command_prints_serving_url(mocker):
     )
 
 
-def test_status_command_renders_resume_state(mocker):
-    config = Config(
-        grid_size=3, path_min_length=4, path_max_length=9, db_path="test.db", adb_timeout=30
+_NO_RESUME_INFO = ResumeInfo(
+    attempted_count=0,
+    latest_run_id=None,
+    latest_started_at=None,
+    latest_finished_at=None,
+    latest_status=None,
+    latest_successful_attempt=None,
+)
+
+
+@pytest.fixture
+def status_context(mocker):
+    """Patch config loading and resume lookup for the status command.
+
+    Returns a function taking Config overrides and an optional ResumeInfo; tests
+    override only the fields they exercise.
+    """
+
+    def install(resume_info=_NO_RESUME_INFO, **config_overrides):
+        config = Config(
+            **{
+                "grid_size": 3,
+                "path_min_length": 4,
+                "path_max_length": 9,
+                "db_path": "test.db",
+                "adb_timeout": 30,
+                **config_overrides,
+            }
+        )
+        mocker.patch("gapbf.main.Config.load_config", return_value=config)
+        mocker.patch(
+            "gapbf.main.load_resume_context",
+            return_value=mocker.Mock(device_id="SERIAL123", resume_info=resume_info),
+        )
+        return config
+
+    return install
+
+
+def test_status_command_renders_resume_state(mocker, status_context):
+    status_context(
+        resume_info=ResumeInfo(
+            attempted_count=25,
+            latest_run_id="run-1",
+            latest_started_at="2026-03-18T10:00:00+00:00",
+            latest_finished_at=None,
+            latest_status="running",
+            latest_successful_attempt=None,
+        )
     )
-    mocker.patch("gapbf.main.Config.load_config", return_value=config)
     mocker.patch("gapbf.main._should_auto_count_status_totals", return_value=True)
     path_finder = mocker.Mock()
     future = mocker.Mock()
@@ -137,20 +222,6 @@ def test_status_command_renders_resume_state(mocker):
     future.result.return_value = 389112
     path_finder.calculate_total_paths_async.return_value = future
     mocker.patch("gapbf.main.create_path_finder", return_value=path_finder)
-    mocker.patch(
-        "gapbf.main.load_resume_context",
-        return_value=mocker.Mock(
-            device_id="SERIAL123",
-            resume_info=ResumeInfo(
-                attempted_count=25,
-                latest_run_id="run-1",
-                latest_started_at="2026-03-18T10:00:00+00:00",
-                latest_finished_at=None,
-                latest_status="running",
-                latest_successful_attempt=None,
-            ),
-        ),
-    )
 
     result = runner.invoke(app, ["status"])
 
@@ -162,32 +233,10 @@ def test_status_command_renders_resume_state(mocker):
     assert "389,112" in result.stdout
 
 
-def test_status_command_uses_configured_total_paths_without_calculating(mocker):
-    config = Config(
-        grid_size=5,
-        path_min_length=4,
-        path_max_length=20,
-        db_path="test.db",
-        adb_timeout=30,
-        total_paths=123456,
-    )
-    mocker.patch("gapbf.main.Config.load_config", return_value=config)
+def test_status_command_uses_configured_total_paths_without_calculating(mocker, status_context):
+    status_context(grid_size=5, path_max_length=20, total_paths=123456)
     path_finder = mocker.Mock()
     mocker.patch("gapbf.main.create_path_finder", return_value=path_finder)
-    mocker.patch(
-        "gapbf.main.load_resume_context",
-        return_value=mocker.Mock(
-            device_id="SERIAL123",
-            resume_info=ResumeInfo(
-                attempted_count=0,
-                latest_run_id=None,
-                latest_started_at=None,
-                latest_finished_at=None,
-                latest_status=None,
-                latest_successful_attempt=None,
-            ),
-        ),
-    )
 
     result = runner.invoke(app, ["status"])
 
@@ -196,36 +245,14 @@ def test_status_command_uses_configured_total_paths_without_calculating(mocker):
     path_finder.calculate_total_paths_async.assert_not_called()
 
 
-def test_status_command_can_force_total_path_calculation(mocker):
-    config = Config(
-        grid_size=3,
-        path_min_length=4,
-        path_max_length=9,
-        db_path="test.db",
-        adb_timeout=30,
-        total_paths=0,
-    )
-    mocker.patch("gapbf.main.Config.load_config", return_value=config)
+def test_status_command_can_force_total_path_calculation(mocker, status_context):
+    status_context(total_paths=0)
     path_finder = mocker.Mock()
     future = mocker.Mock()
     future.done.return_value = True
     future.result.return_value = 389112
     path_finder.calculate_total_paths_async.return_value = future
     mocker.patch("gapbf.main.create_path_finder", return_value=path_finder)
-    mocker.patch(
-        "gapbf.main.load_resume_context",
-        return_value=mocker.Mock(
-            device_id="SERIAL123",
-            resume_info=ResumeInfo(
-                attempted_count=0,
-                latest_run_id=None,
-                latest_started_at=None,
-                latest_finished_at=None,
-                latest_status=None,
-                latest_successful_attempt=None,
-            ),
-        ),
-    )
 
     result = runner.invoke(app, ["status", "--calculate-total-paths"])
 
@@ -233,33 +260,13 @@ def test_status_command_can_force_total_path_calculation(mocker):
     assert "389,112" in result.stdout
 
 
-def test_status_command_skips_background_total_counting_when_non_interactive(mocker):
-    config = Config(
-        grid_size=3,
-        path_min_length=4,
-        path_max_length=9,
-        db_path="test.db",
-        adb_timeout=30,
-        total_paths=0,
-    )
-    mocker.patch("gapbf.main.Config.load_config", return_value=config)
+def test_status_command_skips_background_total_counting_when_non_interactive(
+    mocker, status_context
+):
+    status_context(total_paths=0)
     mocker.patch("gapbf.main._should_auto_count_status_totals", return_value=False)
     path_finder = mocker.Mock()
     mocker.patch("gapbf.main.create_path_finder", return_value=path_finder)
-    mocker.patch(
-        "gapbf.main.load_resume_context",
-        return_value=mocker.Mock(
-            device_id="SERIAL123",
-            resume_info=ResumeInfo(
-                attempted_count=0,
-                latest_run_id=None,
-                latest_started_at=None,
-                latest_finished_at=None,
-                latest_status=None,
-                latest_successful_attempt=None,
-            ),
-        ),
-    )
 
     result = runner.invoke(app, ["status"])
 
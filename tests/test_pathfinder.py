@@ -17,20 +17,38 @@ class MockHandler(PathHandler):
         return self.return_value
 
 
+@pytest.fixture(scope="module")
+def pf3():
+    """Unconstrained 3x3 PathFinder shared by read-only tests; do not add handlers."""
+    return PathFinder(grid_size=3, path_min_len=4, path_max_len=9)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        {"path_prefix": [1, 2]},
+        {"excluded_nodes": [5]},
+        {"path_min_len": 5, "path_max_len": 6},
+        {"path_prefix": [1], "path_suffix": [9], "excluded_nodes": [5], "path_max_len": 4},
+    ],
+    ids=["prefix", "excluded", "lengths", "combined"],
+)
+def dfs_run(request):
+    """Run one failing DFS per constraint set and share its attempted paths across tests."""
+    options = {"grid_size": 3, "path_min_len": 4, "path_max_len": 6, **request.param}
+    pf = PathFinder(**options)
+    handler = MockHandler()
+    pf.add_handler(handler)
+    pf.dfs()
+    return options, pf, handler.called_paths
+
+
 class TestPathFinder:
     """Unit tests for the PathFinder class."""
 
-    def test_init_3x3_grid(self):
+    def test_init_3x3_grid(self, pf3):
         """Test PathFinder initialization with 3x3 grid."""
-        pf = PathFinder(
-            grid_size=3,
-            path_min_len=4,
-            path_max_len=9,
-            path_max_node_distance=1,
-            path_prefix=[],
-            path_suffix=[],
-            excluded_nodes=[],
-        )
+        pf = pf3
 
         assert pf._grid_size == 3
         assert pf._path_min_len == 4
@@ -56,6 +74,17 @@ class TestPathFinder:
         assert ":" in pf._graph
         assert "@" in pf._graph
 
+    def test_grid_geometry_is_shared_between_instances(self, pf3):
+        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=5, excluded_nodes=[5])
+
+        assert pf._intermediate_nodes is pf3._intermediate_nodes
+        assert pf._crossing_cache is pf3._crossing_cache
+        assert pf._move_masks != pf3._move_masks
+        with pytest.raises(TypeError):
+            pf._neighbors["1"] = frozenset()
+        with pytest.raises(TypeError):
+            pf._crossing_cache["diagonal"][("1", "5")] = frozenset()
+
     def test_init_invalid_grid_size(self):
         """Test PathFinder with invalid grid size raises error."""
         with pytest.raises(ValueError, match="Unsupported grid size"):
@@ -102,23 +131,19 @@ class TestPathFinder:
 
         assert future.result(timeout=5) > 0
 
-    def test_constraints_path_prefix(self):
-        """Test PathFinder respects path prefix constraint."""
-        pf = PathFinder(grid_size=3, path_min_len=3, path_max_len=5, path_prefix=[1, 2])
-
-        assert pf._path_prefix == ["1", "2"]
-
-    def test_constraints_path_suffix(self):
-        """Test PathFinder respects path suffix constraint."""
-        pf = PathFinder(grid_size=3, path_min_len=3, path_max_len=5, path_suffix=[8, 9])
+    @pytest.mark.parametrize(
+        ("option", "value", "attribute", "expected"),
+        [
+            ("path_prefix", [1, 2], "_path_prefix", ["1", "2"]),
+            ("path_suffix", [8, 9], "_path_suffix", ["8", "9"]),
+            ("excluded_nodes", [5, 6], "_excluded_nodes", {"5", "6"}),
+        ],
+    )
+    def test_constraints_are_normalized_to_string_nodes(self, option, value, attribute, expected):
+        """Test PathFinder stores prefix, suffix and excluded nodes as string nodes."""
+        pf = PathFinder(grid_size=3, path_min_len=3, path_max_len=5, **{option: value})
 
-        assert pf._path_suffix == ["8", "9"]
-
-    def test_constraints_excluded_nodes(self):
-        """Test PathFinder respects excluded nodes constraint."""
-        pf = PathFinder(grid_size=3, path_min_len=3, path_max_len=5, excluded_nodes=[5, 6])
-
-        assert pf._excluded_nodes == {"5", "6"}
+        assert getattr(pf, attribute) == expected
 
     def test_no_diagonal_crossings_rejects_crossing_prefix(self):
         with pytest.raises(ValueError, match="illegal move in path_prefix"):
@@ -142,12 +167,66 @@ class TestPathFinder:
                 path_prefix=[1, 5, 2, 4],
             )
 
+    def test_crossing_masks_mark_conflicting_edges(self):
+        pf = PathFinder(
+            grid_size=3,
+            path_min_len=4,
+            path_max_len=9,
+            no_diagonal_crossings=True,
+        )
+        masks = pf._crossing_masks
+        bits = pf._edge_bits
+
+        assert masks[0][1] == 0
+        assert masks[1][3] & bits[0][4]
+        assert masks[3][1] & bits[4][0]
+        assert not masks[1][3] & bits[1][2]
+
     def test_max_node_distance_limits_long_jumps(self):
         pf = PathFinder(grid_size=3, path_min_len=3, path_max_len=5, path_max_node_distance=1)
 
         assert "3" not in pf._neighbors["1"]
         assert "5" in pf._neighbors["1"]
 
+    def test_suffix_distances_bound_moves_to_first_suffix_node(self):
+        pf = PathFinder(
+            grid_size=3,
+            path_min_len=4,
+            path_max_len=5,
+            path_max_node_distance=1,
+            path_suffix=[1, 2],
+        )
+
+        assert pf._suffix_distances[pf._node_to_index["1"]] == 0
+        assert pf._suffix_distances[pf._node_to_index["5"]] == 1
+        assert pf._suffix_distances[pf._node_to_index["9"]] == 2
+        assert all(path[-2:] == ["1", "2"] for path in pf)
+
+    def test_started_suffix_is_followed_to_its_end(self, mocker):
+        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=6, path_suffix=[5, 1, 2])
+        move_filter = mocker.spy(pf, "_legal_move_indices_without_crossings")
+
+        paths = list(pf)
+
+        assert paths and all(path[-3:] == ["5", "1", "2"] for path in paths)
+        assert len(paths) == pf._calculate_total_paths()
+        # A path that already ends with the whole suffix is never expanded further.
+        suffix_mask = (
+            pf._node_masks[pf._node_to_index["5"]] | pf._node_masks[pf._node_to_index["1"]]
+        )
+        assert not any(
+            call.args[0] == pf._node_to_index["2"] and call.args[1] & suffix_mask == suffix_mask
+            for call in move_filter.call_args_list
+        )
+
+    def test_iter_batches_preserves_path_order(self):
+        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=5, path_prefix=[1])
+
+        batches = list(pf.iter_batches(batch_size=100))
+
+        assert all(len(batch) == 100 for batch in batches[:-1])
+        assert [path for batch in batches for path in batch] == list(pf)
+
     def test_calculate_total_paths_updates_config(self):
         """Test that _calculate_total_paths correctly calculates path count."""
         # Note: PathFinder no longer automatically writes to config.yaml
@@ -194,6 +273,43 @@ class TestPathFinder:
 
         assert pf._calculate_total_paths() == sum(1 for _ in pf)
 
+    def test_calculate_total_paths_with_count_workers_matches_sequential(self):
+        options = dict(
+            grid_size=3,
+            path_min_len=4,
+            path_max_len=5,
+            no_diagonal_crossings=True,
+        )
+
+        parallel_total = PathFinder(**options, count_workers=2)._calculate_total_paths()
+
+        assert parallel_total == PathFinder(**options)._calculate_total_paths()
+
+    def test_start_orbits_only_apply_to_symmetric_configurations(self):
+        assert PathFinder(grid_size=3)._start_orbits() == ((0, 4), (1, 4), (4, 1))
+        assert PathFinder(grid_size=3, excluded_nodes=[1])._start_orbits() == ()
+        assert PathFinder(grid_size=3, path_suffix=[5])._start_orbits() == ()
+
+    def test_estimate_total_paths_is_close_to_exact_count(self):
+        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=5)
+
+        estimate = pf.estimate_total_paths(samples=5_000, seed=7)
+
+        assert abs(estimate - pf._calculate_total_paths()) < pf._calculate_total_paths() * 0.1
+
+    def test_estimate_total_paths_is_zero_without_start_states(self):
+        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=5, excluded_nodes=range(1, 10))
+
+        assert pf._search_starts == ()
+        assert pf.estimate_total_paths(samples=10, seed=7) == 0
+
+    def test_calculate_total_paths_is_shared_by_identical_configurations(self, mocker):
+        total = PathFinder(grid_size=3, path_min_len=4, path_max_len=5)._calculate_total_paths()
+        count = mocker.patch.object(PathFinder, "_count_total_paths")
+
+        assert PathFinder(grid_size=3, path_min_len=4, path_max_len=5).total_paths == total
+        count.assert_not_called()
+
     def test_calculate_total_paths_no_valid_paths(self):
         """Test _calculate_total_paths raises error when no valid paths exist."""
         pf = PathFinder(
@@ -208,6 +324,7 @@ class TestPathFinder:
         with pytest.raises(ValueError, match="No paths found with given configuration"):
             pf._calculate_total_paths()
 
+    @pytest.mark.dfs
     def test_dfs_with_successful_path(self):
         """Test DFS search finds successful path."""
         pf = PathFinder(
@@ -233,6 +350,16 @@ class TestPathFinder:
         assert success is True
         assert len(path) >= 4
 
+    @pytest.mark.dfs
+    def test_dfs_returns_found_path_when_handler_does_not_echo_it(self):
+        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=4)
+        handler = MockHandler()
+        handler.handle_path = lambda path, total_paths=None: (path == ["1", "2", "3", "6"], None)
+        pf.add_handler(handler)
+
+        assert pf.dfs() == (True, ["1", "2", "3", "6"])
+
+    @pytest.mark.dfs
     def test_dfs_no_successful_path(self):
         """Test DFS search when no path succeeds."""
         pf = PathFinder(
@@ -252,53 +379,9 @@ class TestPathFinder:
         assert success is False
         assert path == []
 
-    def test_dfs_with_path_prefix(self):
-        """Test DFS search respects path prefix."""
-        pf = PathFinder(
-            grid_size=3,
-            path_min_len=4,
-            path_max_len=6,
-            path_prefix=[1, 2],
-            path_suffix=[],
-            excluded_nodes=[],
-        )
-
-        handler = MockHandler()
-        pf.add_handler(handler)
-
-        # Run DFS (will fail but we check the paths attempted)
-        pf.dfs()
-
-        # All attempted paths should start with ['1', '2']
-        for attempted_path in handler.called_paths:
-            if len(attempted_path) >= 2:
-                assert attempted_path[0] == "1"
-                assert attempted_path[1] == "2"
-
-    def test_dfs_with_excluded_nodes(self):
-        """Test DFS search respects excluded nodes."""
-        pf = PathFinder(
-            grid_size=3,
-            path_min_len=4,
-            path_max_len=6,
-            path_prefix=[],
-            path_suffix=[],
-            excluded_nodes=[5],  # Exclude center node
-        )
-
-        handler = MockHandler()
-        pf.add_handler(handler)
-
-        # Run DFS
-        pf.dfs()
-
-        # No attempted path should contain node 5
-        for attempted_path in handler.called_paths:
-            assert 5 not in attempted_path
-
-    def test_neighbors_accessibility(self):
+    def test_neighbors_accessibility(self, pf3):
         """Test that neighbor relationships are properly defined."""
-        pf = PathFinder(grid_size=3, path_min_len=4, path_max_len=9)
+        pf = pf3
 
         # Test some known neighbor relationships for 3x3 grid
         # Neighbors are stored as strings now
@@ -309,53 +392,33 @@ class TestPathFinder:
         # Center node (5) should connect to all others
         assert len(pf._neighbors["5"]) == 8
 
-    def test_path_length_constraints_in_dfs(self):
-        """Test that DFS respects min and max path length constraints."""
-        pf = PathFinder(
-            grid_size=3,
-            path_min_len=5,
-            path_max_len=6,
-            path_prefix=[],
-            path_suffix=[],
-            excluded_nodes=[],
-        )
+    @pytest.mark.dfs
+    def test_dfs_attempts_only_paths_meeting_constraints(self, dfs_run):
+        """Test DFS respects prefix, suffix, exclusion and length constraints."""
+        options, _pf, called_paths = dfs_run
+        prefix = [str(node) for node in options.get("path_prefix", [])]
+        suffix = [str(node) for node in options.get("path_suffix", [])]
+        excluded = {str(node) for node in options.get("excluded_nodes", [])}
 
-        handler = MockHandler()
-        pf.add_handler(handler)
+        assert called_paths
+        for attempted_path in called_paths:
+            assert options["path_min_len"] <= len(attempted_path) <= options["path_max_len"]
+            assert attempted_path[: len(prefix)] == prefix
+            assert attempted_path[len(attempted_path) - len(suffix) :] == suffix
+            assert not excluded & set(attempted_path)
 
-        pf.dfs()
+    @pytest.mark.dfs
+    def test_dfs_attempts_every_counted_path_once(self, dfs_run):
+        """Test DFS hands each path to the handler exactly once, matching the total."""
+        _options, pf, called_paths = dfs_run
 
-        # All attempted paths should be between min and max length
-        for attempted_path in handler.called_paths:
-            assert 5 <= len(attempted_path) <= 6
+        assert len({"".join(path) for path in called_paths}) == len(called_paths)
+        assert len(called_paths) == pf._calculate_total_paths()
 
 
 class TestPathFinderIntegration:
     """Integration tests for PathFinder with realistic scenarios."""
 
-    def test_complete_search_small_grid(self):
-        """Test complete search on small constrained grid."""
-        pf = PathFinder(
-            grid_size=3,
-            path_min_len=4,
-            path_max_len=4,  # Only 4-node paths
-            path_prefix=[1],  # Must start with 1
-            path_suffix=[9],  # Must end with 9
-            excluded_nodes=[5],  # Exclude center
-        )
-
-        handler = MockHandler()
-        pf.add_handler(handler)
-
-        pf.dfs()
-
-        # Verify all paths meet constraints
-        for path in handler.called_paths:
-            assert len(path) == 4
-            assert path[0] == "1"
-            assert path[-1] == "9"
-            assert "5" not in path
-
     def test_total_paths_calculation_accuracy(self):
         """Test that total paths calculation is accurate."""
         pf = PathFinder(
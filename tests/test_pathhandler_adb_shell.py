@@ -0,0 +1,124 @@
+import subprocess
+
+import pytest
+
+from gapbf.Config import Config
+from gapbf.PathHandler import ADBHandler
+from gapbf.pathhandler_adb_shell import ADBShellSession
+
+
+class TestADBShellSession:
+    def test_run_reuses_one_process_and_captures_output(self):
+        session = ADBShellSession(["sh"])
+        try:
+            first = session.run("echo Failed to decrypt; echo warn >&2; false", timeout=5)
+            process = session._process
+            second = session.run("echo ok", timeout=5)
+        finally:
+            session.close()
+
+        assert first.returncode == 1
+        assert first.stdout == "Failed to decrypt\nwarn\n"
+        assert first.stderr == ""
+        assert second.returncode == 0
+        assert second.stdout == "ok\n"
+        assert session._process is None
+        assert process is not None and process.returncode is not None
+
+    def test_run_finishes_on_a_shell_that_merges_stderr_into_stdout(self):
+        # Mimics adbd without shell_v2, where the device shell has no separate stderr.
+        session = ADBShellSession(["sh", "-c", "exec sh 2>&1"])
+        try:
+            result = session.run("echo warn >&2; echo Failed to decrypt", timeout=5)
+        finally:
+            session.close()
+
+        assert result.returncode == 0
+        assert result.stdout == "warn\nFailed to decrypt\n"
+
+    def test_run_timeout_kills_and_restarts_lazily(self):
+        session = ADBShellSession(["sh"])
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                session.run("sleep 5", timeout=0.2)
+            assert session.running is False
+            assert session.run("echo again", timeout=5).stdout == "again\n"
+        finally:
+            session.close()
+
+    def test_run_respawns_a_shell_that_exited_between_commands(self):
+        session = ADBShellSession(["sh"])
+        try:
+            session.run("echo first", timeout=5)
+            process = session._process
+            assert process is not None and process.stdin is not None
+            process.stdin.write(b"exit\n")
+            process.wait(timeout=5)
+            assert session.run("echo second", timeout=5).stdout == "second\n"
+            assert session._process is not process
+        finally:
+            session.close()
+
+    def test_run_retries_once_on_broken_pipe(self, mocker):
+        session = ADBShellSession(["sh"])
+        dead_process = mocker.Mock()
+        dead_process.poll.return_value = None
+        dead_process.stdin.write.side_effect = BrokenPipeError
+        session._process = dead_process
+        try:
+            assert session.run("echo retried", timeout=5).stdout == "retried\n"
+        finally:
+            session.close()
+
+        dead_process.kill.assert_called_once_with()
+
+    def test_start_spawns_through_the_injected_popen(self, mocker):
+        popen = mocker.Mock()
+        popen.return_value.poll.return_value = None
+        session = ADBShellSession(["adb", "-s", "SERIAL123", "shell"], popen=popen)
+
+        session.start()
+        session.start()
+
+        popen.assert_called_once_with(
+            ["adb", "-s", "SERIAL123", "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+
+
+def test_adbhandler_persistent_shell_skips_start_server(mocker):
+    config = Config(
+        grid_size=3,
+        path_min_length=4,
+        path_max_length=9,
+        stdout_normal="Failed",
+        adb_persistent_shell=True,
+        echo_commands=False,
+    )
+    database = mocker.Mock()
+    database.get_terminal_attempt_history.return_value = {}
+    subprocess_run = mocker.patch("gapbf.PathHandler.subprocess.run")
+    subprocess_popen = mocker.patch("gapbf.PathHandler.subprocess.Popen")
+    shell_run = mocker.patch.object(
+        ADBShellSession,
+        "run",
+        return_value=subprocess.CompletedProcess(["sh"], 0, "Failed", ""),
+    )
+    shell_close = mocker.patch.object(ADBShellSession, "close")
+
+    handler = ADBHandler(
+        config, database=database, run_id="run-1", device_id="SERIAL123", output=mocker.Mock()
+    )
+    success, _ = handler.handle_path(["1", "2", "3", "4"], total_paths=10)
+    handler.close()
+
+    assert success is False
+    subprocess_run.assert_not_called()
+    assert handler.shell_session is not None
+    assert handler.shell_session.argv == ["adb", "-s", "SERIAL123", "shell"]
+    assert handler.shell_session._popen is subprocess_popen
+    shell_run.assert_called_once_with("twrp decrypt 1234", 30)
+    shell_close.assert_called_once_with()
@@ -51,6 +51,21 @@ class TestTestHandler:
         assert path is None
         reporter.show_test_result.assert_called_once()
 
+    def test_handle_paths_scans_batch_for_test_path(self):
+        config = Config(grid_size=3, path_min_length=4, path_max_length=9, test_path=[1, 2, 3, 6])
+        reporter = Mock()
+        handler = GapbfTestHandler(config, reporter)
+        batch = [["1", "2", "3", "4"], ["1", "2", "3", "5"], ["1", "2", "3", "6"]]
+
+        assert handler.handle_paths(batch[:2], total_paths=10) == (False, None)
+        assert handler.current_path_number == 2
+        reporter.show_test_result.assert_not_called()
+        assert handler.handle_paths(batch, total_paths=10) == (True, ["1", "2", "3", "6"])
+        assert handler.current_path_number == 5
+        reporter.show_test_result.assert_called_once_with(
+            success=True, current=5, total=10, percentage=50.0, path=["1", "2", "3", "6"]
+        )
+
 
 class TestPrintHandler:
     def test_printhandler_init(self):
@@ -69,7 +84,11 @@ class TestPrintHandler:
 
         assert success is False
         assert path is None
-        reporter.show_print_path.assert_called_once()
+        reporter.show_print_path.assert_called_once_with(
+            ["1", "2", "3"],
+            ["●●●", "○○○", "○○○"],
+            ["1 2 3", "· · ·", "· · ·"],
+        )
 
     def test_render_path_3x3(self):
         config = Config(grid_size=3, path_min_length=4, path_max_length=9)
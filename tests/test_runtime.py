@@ -1,6 +1,9 @@
+from concurrent.futures import Future
+
 import pytest
 from rich.console import Console
 
+from gapbf.cli_live import sync_live_total_paths
 from gapbf.Config import Config
 from gapbf.Database import ResumeInfo
 from gapbf.Output import Output
@@ -62,6 +65,25 @@ def test_execute_path_search_returns_success_for_matching_test_handler():
     assert completed_paths == [["1", "2", "3", "6"]]
 
 
+def test_add_handlers_attaches_one_handler_per_mode_key(mocker):
+    config = Config(grid_size=3, path_min_length=4, path_max_length=4)
+    path_finder = mocker.Mock(grid_nodes=[str(node) for node in range(1, 10)])
+
+    handlers = add_handlers(
+        path_finder,
+        config,
+        "pt",
+        database=None,
+        run_id=None,
+        device_id=None,
+        output=Output(console=Console(), silent=True),
+    )
+
+    attached = [call.args[0] for call in path_finder.add_handler.call_args_list]
+    assert attached == handlers
+    assert {type(handler).__name__ for handler in attached} == {"PrintHandler", "TestHandler"}
+
+
 def test_execute_path_search_honors_stop_requests():
     config = Config(grid_size=3, path_min_length=4, path_max_length=4, path_prefix=["1", "2"])
     path_finder = PathFinder(
@@ -125,6 +147,32 @@ def test_run_controller_updates_state_on_success():
     assert snapshot["last_feedback"] == "Pattern found: 1236"
 
 
+def test_run_controller_polls_state_flags():
+    state = RunState(config=None, mode="t", total_paths=12)
+    controller = RunController(state)
+    state.toggle_pause()
+    state.request_quit()
+
+    assert controller.is_paused() is True
+    assert controller.should_stop() is True
+    assert controller.total_paths_provider() == 12
+
+
+def test_total_paths_estimate_is_provisional_until_the_exact_count():
+    state = RunState(config=None, mode="t", total_paths=None)
+    controller = RunController(state)
+    exact_total: Future[int] = Future()
+    state.mark_total_paths_counting()
+    state.set_total_paths_estimate(1_000)
+
+    assert controller.total_paths_provider() == 1_000
+    assert state.total_paths_state == "estimated"
+    exact_total.set_result(1_024)
+    sync_live_total_paths(state, exact_total)
+    assert controller.total_paths_provider() == 1_024
+    assert state.total_paths_state == "ready"
+
+
 def test_load_resume_context_uses_shared_persistent_lookup(mocker):
     config = Config(grid_size=3, path_min_length=4, path_max_length=5, db_path="test.db")
     database = mocker.Mock()
@@ -56,6 +56,7 @@ def test_total_path_count_timeout_falls_back_to_unknown_total(tmp_path, monkeypa
         raise AssertionError("web total-path count did not time out")
 
     assert snapshot["total_paths"] is None
+    assert snapshot["total_paths_estimate"] == 1
     assert snapshot["total_paths_elapsed_seconds"] >= 0
     assert snapshot["total_paths_timeout_seconds"] == 30
     assert "unknown total" in snapshot["last_feedback"].lower()
\ No newline at end of file